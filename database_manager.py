@@ -9,8 +9,8 @@ import json
 import os
 import logging
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+from dataclasses import dataclass, field
 from pathlib import Path
 
 @dataclass
@@ -23,6 +23,9 @@ class ChatConversation:
     last_modified_at: str
     parsed_data: Optional[Dict[str, Any]] = None
     message_count: int = 0
+    # Rendered summary and text, built on first use and reused afterwards
+    _summary_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _readable_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Parse conversation data and extract metadata"""
@@ -48,6 +51,12 @@ class ChatConversation:
     
     def get_summary(self) -> str:
         """Get a summary of the conversation"""
+        if self._summary_cache is None:
+            self._summary_cache = self._build_summary()
+        return self._summary_cache
+    
+    def _build_summary(self) -> str:
+        """Describe the task counts of parsed_data"""
         if not self.parsed_data:
             return "No data available"
         
@@ -69,6 +78,12 @@ class ChatConversation:
     
     def get_readable_content(self) -> str:
         """Get human-readable conversation content"""
+        if self._readable_cache is None:
+            self._readable_cache = self._build_readable_content()
+        return self._readable_cache
+    
+    def _build_readable_content(self) -> str:
+        """Render parsed_data as text for previews and exports"""
         if not self.parsed_data:
             return "No conversation content available."
         
@@ -186,6 +201,9 @@ class WarpDatabaseManager:
         except sqlite3.Error as e:
             self.logger.error(f"Failed to retrieve conversations: {e}")
             return []
+    
+    def get_conversation_by_id(self, conversation_id: str) -> Optional[ChatConversation]:
+        """Retrieve a specific conversation by ID"""
         query = """
         SELECT id, conversation_id, active_task_id, conversation_data, last_modified_at
         FROM agent_conversations
@@ -211,6 +229,93 @@ class WarpDatabaseManager:
             self.logger.error(f"Failed to retrieve conversation {conversation_id}: {e}")
             return None
     
+    def get_conversation_count(self) -> int:
+        """Count conversations without loading their data"""
+        if not self.database_available:
+            return 0
+        
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.execute("SELECT COUNT(*) FROM agent_conversations")
+                return cursor.fetchone()[0]
+                
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to count conversations: {e}")
+            return 0
+    
+    def get_all_conversation_ids(self) -> Set[str]:
+        """Fetch every conversation_id without loading conversation data"""
+        if not self.database_available:
+            return set()
+        
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.execute("SELECT conversation_id FROM agent_conversations")
+                return {row[0] for row in cursor}
+                
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to retrieve conversation ids: {e}")
+            return set()
+    
+    def iter_conversations(self, limit: Optional[int] = None) -> Iterator[ChatConversation]:
+        """Yield the most recent conversations, fetching at most `limit` rows"""
+        if not self.database_available:
+            return
+        
+        query = """
+        SELECT id, conversation_id, active_task_id, conversation_data, last_modified_at
+        FROM agent_conversations
+        ORDER BY last_modified_at DESC
+        LIMIT ?
+        """
+        
+        try:
+            with self.get_connection() as conn:
+                # SQLite treats a negative LIMIT as "no limit"
+                cursor = conn.execute(query, (limit if limit is not None else -1,))
+                for row in cursor:
+                    yield ChatConversation(
+                        id=row['id'],
+                        conversation_id=row['conversation_id'],
+                        active_task_id=row['active_task_id'],
+                        conversation_data=row['conversation_data'],
+                        last_modified_at=row['last_modified_at']
+                    )
+                    
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to iterate conversations: {e}")
+    
+    def get_conversations_paged(self, limit: int, offset: int = 0) -> List[ChatConversation]:
+        """Retrieve one page of conversations, most recent first"""
+        if not self.database_available:
+            return []
+        
+        # id breaks ties so pages neither overlap nor skip rows
+        query = """
+        SELECT id, conversation_id, active_task_id, conversation_data, last_modified_at
+        FROM agent_conversations
+        ORDER BY last_modified_at DESC, id DESC
+        LIMIT ? OFFSET ?
+        """
+        
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.execute(query, (limit, offset))
+                return [
+                    ChatConversation(
+                        id=row['id'],
+                        conversation_id=row['conversation_id'],
+                        active_task_id=row['active_task_id'],
+                        conversation_data=row['conversation_data'],
+                        last_modified_at=row['last_modified_at']
+                    )
+                    for row in cursor
+                ]
+                
+        except sqlite3.Error as e:
+            self.logger.error(f"Failed to retrieve conversations page at offset {offset}: {e}")
+            return []
+    
     def search_conversations(self, query: str) -> List[ChatConversation]:
         """Search conversations by content"""
         sql_query = """
@@ -247,10 +352,13 @@ class WarpDatabaseManager:
     
     def get_conversations_by_date_range(self, start_date: str, end_date: str) -> List[ChatConversation]:
         """Retrieve conversations within a date range"""
+        # Compare the raw column against the range bounds instead of wrapping
+        # it in date(), so SQLite can use an index on last_modified_at and
+        # skip the per-row function call; the end date stays inclusive
         query = """
         SELECT id, conversation_id, active_task_id, conversation_data, last_modified_at
         FROM agent_conversations
-        WHERE date(last_modified_at) BETWEEN ? AND ?
+        WHERE last_modified_at >= ? AND last_modified_at < date(?, '+1 day')
         ORDER BY last_modified_at DESC
         """
         
@@ -7,20 +7,66 @@ Handles exporting conversations to various formats
 import json
 import html
 import csv
+import os
+import io
+import threading
+import concurrent.futures
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 from datetime import datetime
 from security_utils import validate_export_path, safe_filename, SecurityError
 from database_manager import ChatConversation
 
+# Write buffer for export files, which are all written piece by piece
+EXPORT_WRITE_BUFFER = 1024 * 1024
+
+
+# Upper bound on the characters of rendered Markdown/HTML kept for re-exports
+RENDER_CACHE_MAX_CHARS = 32 * 1024 * 1024
+
+
+class _RenderCache:
+    """Least-recently-used rendered conversation bodies, bounded by total size"""
+    
+    def __init__(self, max_chars: int):
+        self.max_chars = max_chars
+        self._bodies: "OrderedDict[Tuple, str]" = OrderedDict()
+        self._chars = 0
+        # Exports run on several GUI worker threads at once
+        self._lock = threading.Lock()
+    
+    def get(self, key: Tuple) -> Optional[str]:
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+            return body
+    
+    def put(self, key: Tuple, body: str):
+        if len(body) > self.max_chars:
+            return
+        with self._lock:
+            old = self._bodies.pop(key, None)
+            if old is not None:
+                self._chars -= len(old)
+            self._bodies[key] = body
+            self._chars += len(body)
+            while self._chars > self.max_chars:
+                _, evicted = self._bodies.popitem(last=False)
+                self._chars -= len(evicted)
+
 
 class ExportManager:
     """Manages export operations for Warp conversations"""
     
+    INDIVIDUAL_FORMATS = ('json', 'md', 'html', 'csv')
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
+        self._render_cache = _RenderCache(RENDER_CACHE_MAX_CHARS)
     
     def export_to_json(self, conversations: List[Dict], output_path: str) -> bool:
         """Export conversations to JSON format"""
@@ -31,28 +77,31 @@ class ExportManager:
             except SecurityError as e:
                 self.logger.error(f"Export path validation failed: {e}")
                 return False
-            output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            export_data = {
+            # Write the same document json.dump(indent=2) would produce, one
+            # conversation at a time, so the whole export never sits in memory
+            header = json.dumps({
                 'export_timestamp': datetime.now().isoformat(),
-                'total_conversations': len(conversations),
-                'conversations': []
-            }
-            
-            for conv in conversations:
-                conv_data = {
-                    'id': conv.id,
-                    'conversation_id': conv.conversation_id,
-                    'active_task_id': conv.active_task_id,
-                    'last_modified_at': conv.last_modified_at,
-                    'message_count': conv.message_count,
-                    'summary': conv.get_summary(),
-                    'conversation_data': conv.parsed_data or json.loads(conv.conversation_data) if conv.conversation_data else {}
-                }
-                export_data['conversations'].append(conv_data)
+                'total_conversations': len(conversations)
+            }, indent=2, ensure_ascii=False)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            with open(output_file, 'w', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER) as f:
+                f.write(header[:-2])
+                f.write(',\n  "conversations": [')
+                for i, conv in enumerate(conversations):
+                    conv_data = {
+                        'id': conv.id,
+                        'conversation_id': conv.conversation_id,
+                        'active_task_id': conv.active_task_id,
+                        'last_modified_at': conv.last_modified_at,
+                        'message_count': conv.message_count,
+                        'summary': conv.get_summary(),
+                        'conversation_data': conv.parsed_data or json.loads(conv.conversation_data) if conv.conversation_data else {}
+                    }
+                    f.write(',\n    ' if i else '\n    ')
+                    # Encoded strings never contain raw newlines, so re-indenting is safe
+                    f.write(json.dumps(conv_data, indent=2, ensure_ascii=False).replace('\n', '\n    '))
+                f.write('\n  ]\n}' if conversations else ']\n}')
             
             self.logger.info(f"Exported {len(conversations)} conversations to JSON: {output_path}")
             return True
@@ -67,7 +116,7 @@ class ExportManager:
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with open(output_path, 'w', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER) as f:
                 f.write("# Warp Chat Archive\n\n")
                 f.write(f"**Export Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
                 f.write(f"**Total Conversations:** {len(conversations)}\n\n")
@@ -86,7 +135,7 @@ class ExportManager:
                     # Format conversation data
                     if conv.parsed_data:
                         f.write("### Content\n\n")
-                        self._write_conversation_markdown(f, conv.parsed_data)
+                        f.write(self._rendered(conv, 'md', self._write_conversation_markdown))
                     
                     f.write("\n---\n\n")
             
@@ -97,6 +146,19 @@ class ExportManager:
             self.logger.error(f"Failed to export to Markdown: {e}")
             return False
     
+    def _rendered(self, conv: ChatConversation, fmt: str, writer) -> str:
+        """Render a conversation body with writer, reusing earlier renders"""
+        # Imports can rewrite data without touching the timestamp, so the
+        # content hash is part of the key as well
+        key = (conv.conversation_id, conv.last_modified_at, hash(conv.conversation_data), fmt)
+        body = self._render_cache.get(key)
+        if body is None:
+            buffer = io.StringIO()
+            writer(buffer, conv.parsed_data)
+            body = buffer.getvalue()
+            self._render_cache.put(key, body)
+        return body
+    
     def _write_conversation_markdown(self, f, data: Dict[str, Any]):
         """Write conversation data in Markdown format"""
         if 'server_conversation_token' in data:
@@ -136,7 +198,7 @@ class ExportManager:
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', encoding='utf-8') as f:
+            with open(output_path, 'w', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER) as f:
                 # Write HTML header
                 f.write(self._get_html_header())
                 
@@ -172,7 +234,7 @@ class ExportManager:
                     # Format conversation data
                     if conv.parsed_data:
                         f.write("<div class='conversation-content'>\n")
-                        self._write_conversation_html(f, conv.parsed_data)
+                        f.write(self._rendered(conv, 'html', self._write_conversation_html))
                         f.write("</div>\n")
                     
                     f.write("</div>\n\n")
@@ -231,7 +293,7 @@ class ExportManager:
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(output_path, 'w', newline='', encoding='utf-8') as f:
+            with open(output_path, 'w', newline='', encoding='utf-8', buffering=EXPORT_WRITE_BUFFER) as f:
                 writer = csv.writer(f)
                 
                 # Write header
@@ -264,31 +326,26 @@ class ExportManager:
                                       output_dir: str, format: str = 'json') -> bool:
         """Export each conversation as individual files"""
         try:
+            if format not in self.INDIVIDUAL_FORMATS:
+                self.logger.error(f"Unsupported format: {format}")
+                return False
+            
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
             
-            success_count = 0
-            
+            jobs = []
             for conv in conversations:
                 # Create filename with date and ID
                 date_part = conv.last_modified_at.split()[0].replace('-', '')
                 filename = f"{date_part}_{conv.conversation_id[:8]}.{format}"
-                file_path = output_dir / filename
-                
-                if format == 'json':
-                    success = self.export_to_json([conv], str(file_path))
-                elif format == 'md':
-                    success = self.export_to_markdown([conv], str(file_path))
-                elif format == 'html':
-                    success = self.export_to_html([conv], str(file_path))
-                elif format == 'csv':
-                    success = self.export_to_csv([conv], str(file_path))
-                else:
-                    self.logger.error(f"Unsupported format: {format}")
-                    continue
-                
-                if success:
-                    success_count += 1
+                jobs.append((conv, str(output_dir / filename), format))
+            
+            # Overlap the file I/O of the many small writes in threads
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(lambda job: self.export_file(*job), jobs))
+            
+            success_count = sum(1 for success in results if success)
             
             self.logger.info(f"Exported {success_count}/{len(conversations)} individual conversations")
             return success_count == len(conversations)
@@ -297,6 +354,20 @@ class ExportManager:
             self.logger.error(f"Failed to export individual conversations: {e}")
             return False
     
+    def export_file(self, conv: ChatConversation, file_path: str, format: str) -> bool:
+        """Export a single conversation to file_path in the given format"""
+        if format == 'json':
+            return self.export_to_json([conv], file_path)
+        elif format == 'md':
+            return self.export_to_markdown([conv], file_path)
+        elif format == 'html':
+            return self.export_to_html([conv], file_path)
+        elif format == 'csv':
+            return self.export_to_csv([conv], file_path)
+        
+        self.logger.error(f"Unsupported format: {format}")
+        return False
+    
     def _get_html_header(self) -> str:
         """Get HTML document header with CSS"""
         return '''<!DOCTYPE html>
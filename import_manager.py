@@ -6,8 +6,12 @@ Handles importing conversations from various formats and sources
 
 import json
 import gzip
+import os
+import shutil
 import sqlite3
 import csv
+import tempfile
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
@@ -19,6 +23,94 @@ from database_manager import WarpDatabaseManager
 
 from database_manager import WarpDatabaseManager, ChatConversation
 
+# Characters read per refill when streaming a JSON export
+JSON_STREAM_CHUNK = 64 * 1024
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = ' \t\n\r'
+
+
+class _JSONStream:
+    """Incremental reader over a JSON text file for raw_decode"""
+    
+    def __init__(self, f):
+        self.f = f
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+    
+    def _fill(self) -> bool:
+        """Read more text, at least as much as is buffered; False at EOF"""
+        if self.eof:
+            return False
+        chunk = self.f.read(max(JSON_STREAM_CHUNK, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+    
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at EOF)"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _JSON_WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ''
+    
+    def expect(self, char: str):
+        """Consume one structural character"""
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self.buf, self.pos)
+        self.pos += 1
+    
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more as needed"""
+        self.peek()
+        while True:
+            try:
+                obj, end = _JSON_DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                # Most likely the value runs past the buffer
+                if not self._fill():
+                    raise
+                continue
+            if end == len(self.buf) and not self.eof and self._fill():
+                # A number may continue in the next chunk; decode again
+                continue
+            self.pos = end
+            return obj
+
+
+def iter_json_conversations(f):
+    """Yield the items of the top-level 'conversations' array one at a time"""
+    stream = _JSONStream(f)
+    stream.expect('{')
+    if stream.peek() == '}':
+        return
+    while True:
+        key = stream.value()
+        stream.expect(':')
+        if key == 'conversations' and stream.peek() == '[':
+            stream.expect('[')
+            if stream.peek() == ']':
+                stream.pos += 1
+            else:
+                while True:
+                    yield stream.value()
+                    if stream.peek() == ']':
+                        stream.pos += 1
+                        break
+                    stream.expect(',')
+        else:
+            stream.value()
+        if stream.peek() == '}':
+            return
+        stream.expect(',')
+
 
 @dataclass
 class ImportResult:
@@ -40,9 +132,46 @@ class ImportManager:
     def __init__(self, db_manager: Optional[WarpDatabaseManager] = None):
         self.db_manager = db_manager or WarpDatabaseManager()
         self.logger = logging.getLogger(__name__)
+        # Makes the existence check and the write of one conversation atomic
+        # when imports run on several threads
+        self._write_lock = threading.Lock()
     
     def import_from_json(self, file_path: str, overwrite_existing: bool = False) -> ImportResult:
         """Import conversations from JSON export file"""
+        result, conversations = self.read_json(file_path)
+        return self.store_conversations(result, conversations, overwrite_existing)
+    
+    def import_from_backup(self, backup_path: str, overwrite_existing: bool = False) -> ImportResult:
+        """Import conversations from backup file (SQLite or JSON)"""
+        result, conversations = self.read_backup(backup_path)
+        return self.store_conversations(result, conversations, overwrite_existing)
+    
+    def import_from_csv(self, file_path: str, overwrite_existing: bool = False) -> ImportResult:
+        """Import conversations from CSV export file"""
+        result, conversations = self.read_csv(file_path)
+        return self.store_conversations(result, conversations, overwrite_existing)
+    
+    def store_conversations(self, result: ImportResult, conversations: List[Dict[str, Any]],
+                            overwrite_existing: bool) -> ImportResult:
+        """Write conversations returned by one of the read_* methods"""
+        if not result.success:
+            return result
+        
+        for conv_data in conversations:
+            try:
+                success = self._import_conversation_data(conv_data, overwrite_existing)
+                if success:
+                    result.imported_count += 1
+                else:
+                    result.skipped_count += 1
+            except Exception as e:
+                result.add_error(f"Failed to import conversation {conv_data.get('conversation_id', 'unknown')}: {e}")
+        
+        self.logger.info(f"Import completed: {result.imported_count} imported, {result.skipped_count} skipped, {result.error_count} errors")
+        return result
+    
+    def read_json(self, file_path: str) -> Tuple[ImportResult, List[Dict[str, Any]]]:
+        """Read the conversations of a JSON export file without writing them"""
         result = ImportResult(success=False)
         
         try:
@@ -53,7 +182,7 @@ class ImportManager:
             except SecurityError as e:
                 result.add_error(f"Import path validation failed: {e}")
                 self.logger.error(f"Import path validation failed: {e}")
-                return result
+                return result, []
             file_path = Path(file_path)
             
             # Handle compressed files
@@ -67,37 +196,25 @@ class ImportManager:
             # Validate JSON structure
             if not isinstance(data, dict) or 'conversations' not in data:
                 result.add_error("Invalid JSON structure: missing 'conversations' key")
-                return result
+                return result, []
             
             conversations = data['conversations']
             if not isinstance(conversations, list):
                 result.add_error("Invalid JSON structure: 'conversations' must be a list")
-                return result
+                return result, []
             
             self.logger.info(f"Found {len(conversations)} conversations in JSON file")
-            
-            # Import each conversation
-            for conv_data in conversations:
-                try:
-                    success = self._import_conversation_data(conv_data, overwrite_existing)
-                    if success:
-                        result.imported_count += 1
-                    else:
-                        result.skipped_count += 1
-                except Exception as e:
-                    result.add_error(f"Failed to import conversation {conv_data.get('conversation_id', 'unknown')}: {e}")
-            
             result.success = True
-            self.logger.info(f"Import completed: {result.imported_count} imported, {result.skipped_count} skipped, {result.error_count} errors")
+            return result, conversations
             
         except Exception as e:
             result.add_error(f"Failed to process JSON file: {e}")
             self.logger.error(f"JSON import failed: {e}")
         
-        return result
+        return result, []
     
-    def import_from_backup(self, backup_path: str, overwrite_existing: bool = False) -> ImportResult:
-        """Import conversations from backup file (SQLite or JSON)"""
+    def read_backup(self, backup_path: str) -> Tuple[ImportResult, List[Dict[str, Any]]]:
+        """Read the conversations of a backup file (SQLite or JSON) without writing them"""
         result = ImportResult(success=False)
         backup_path = Path(backup_path)
         
@@ -106,14 +223,14 @@ class ImportManager:
             if backup_path.suffix == '.gz':
                 # Compressed file - check the stem
                 if backup_path.stem.endswith('.sqlite'):
-                    return self._import_from_sqlite_backup(str(backup_path), overwrite_existing)
+                    return self._read_sqlite_backup(str(backup_path))
                 elif backup_path.stem.endswith('.json'):
-                    return self.import_from_json(str(backup_path), overwrite_existing)
+                    return self.read_json(str(backup_path))
             else:
                 if backup_path.suffix == '.sqlite':
-                    return self._import_from_sqlite_backup(str(backup_path), overwrite_existing)
+                    return self._read_sqlite_backup(str(backup_path))
                 elif backup_path.suffix == '.json':
-                    return self.import_from_json(str(backup_path), overwrite_existing)
+                    return self.read_json(str(backup_path))
             
             result.add_error(f"Unsupported backup file format: {backup_path}")
             
@@ -121,41 +238,39 @@ class ImportManager:
             result.add_error(f"Failed to import backup: {e}")
             self.logger.error(f"Backup import failed: {e}")
         
-        return result
+        return result, []
     
-    def _import_from_sqlite_backup(self, backup_path: str, overwrite_existing: bool) -> ImportResult:
-        """Import from SQLite backup file"""
+    def _read_sqlite_backup(self, backup_path: str) -> Tuple[ImportResult, List[Dict[str, Any]]]:
+        """Read a SQLite backup file, decompressing it first if needed"""
         result = ImportResult(success=False)
         backup_path = Path(backup_path)
         
         try:
             # Handle compressed SQLite backup
             if backup_path.suffix == '.gz':
-                # Extract to temporary file
-                temp_path = backup_path.parent / f"temp_import_{datetime.now().strftime('%Y%m%d_%H%M%S')}.sqlite"
-                
-                with gzip.open(backup_path, 'rb') as f_in:
-                    with open(temp_path, 'wb') as f_out:
-                        f_out.write(f_in.read())
-                
+                # Extract to a uniquely named temporary file, since several
+                # backups may be read at the same time
+                fd, temp_name = tempfile.mkstemp(prefix="temp_import_", suffix=".sqlite")
                 try:
-                    result = self._import_from_sqlite_file(str(temp_path), overwrite_existing)
+                    with gzip.open(backup_path, 'rb') as f_in, os.fdopen(fd, 'wb') as f_out:
+                        shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+                    return self._read_sqlite_file(temp_name)
                 finally:
                     # Clean up temp file
-                    if temp_path.exists():
-                        temp_path.unlink()
-            else:
-                result = self._import_from_sqlite_file(str(backup_path), overwrite_existing)
+                    os.unlink(temp_name)
+            
+            return self._read_sqlite_file(str(backup_path))
             
         except Exception as e:
             result.add_error(f"Failed to process SQLite backup: {e}")
             self.logger.error(f"SQLite backup import failed: {e}")
         
-        return result
+        return result, []
     
-    def _import_from_sqlite_file(self, sqlite_path: str, overwrite_existing: bool) -> ImportResult:
-        """Import conversations from SQLite database file"""
+    def _read_sqlite_file(self, sqlite_path: str) -> Tuple[ImportResult, List[Dict[str, Any]]]:
+        """Read conversations from a SQLite database file"""
         result = ImportResult(success=False)
+        conversations = []
         
         try:
             # Connect to source database
@@ -169,95 +284,35 @@ class ImportManager:
                 ORDER BY last_modified_at DESC
             """)
             
-            conversations = cursor.fetchall()
+            rows = cursor.fetchall()
             source_conn.close()
             
-            self.logger.info(f"Found {len(conversations)} conversations in SQLite backup")
+            self.logger.info(f"Found {len(rows)} conversations in SQLite backup")
             
-            # Import each conversation
-            for row in conversations:
+            for row in rows:
                 try:
-                    conv_data = {
+                    conversations.append({
                         'id': row['id'],
                         'conversation_id': row['conversation_id'],
                         'active_task_id': row['active_task_id'],
                         'last_modified_at': row['last_modified_at'],
                         'conversation_data': json.loads(row['conversation_data']) if row['conversation_data'] else {}
-                    }
-                    
-                    success = self._import_conversation_data(conv_data, overwrite_existing)
-                    if success:
-                        result.imported_count += 1
-                    else:
-                        result.skipped_count += 1
-                        
+                    })
                 except Exception as e:
                     result.add_error(f"Failed to import conversation {row['conversation_id']}: {e}")
             
             result.success = True
-            self.logger.info(f"SQLite import completed: {result.imported_count} imported, {result.skipped_count} skipped")
             
         except Exception as e:
             result.add_error(f"Failed to read SQLite file: {e}")
             self.logger.error(f"SQLite file import failed: {e}")
         
-        return result
+        return result, conversations
     
-    def _import_conversation_data(self, conv_data: Dict[str, Any], overwrite_existing: bool) -> bool:
-        """Import a single conversation into the database"""
-        try:
-            conversation_id = conv_data.get('conversation_id')
-            if not conversation_id:
-                raise ValueError("Missing conversation_id")
-            
-            # Check if conversation already exists
-            existing_conv = self.db_manager.get_conversation_by_id(conversation_id)
-            
-            if existing_conv and not overwrite_existing:
-                self.logger.debug(f"Skipping existing conversation: {conversation_id}")
-                return False
-            
-            # Prepare conversation data
-            active_task_id = conv_data.get('active_task_id')
-            last_modified_at = conv_data.get('last_modified_at', datetime.now().isoformat())
-            
-            # Handle conversation_data - could be already parsed or raw JSON string
-            conversation_data = conv_data.get('conversation_data', {})
-            if isinstance(conversation_data, str):
-                conversation_data_str = conversation_data
-            else:
-                conversation_data_str = json.dumps(conversation_data, ensure_ascii=False)
-            
-            # Insert or update in database
-            with self.db_manager.get_connection() as conn:
-                if existing_conv and overwrite_existing:
-                    # Update existing
-                    conn.execute("""
-                        UPDATE agent_conversations 
-                        SET active_task_id = ?, conversation_data = ?, last_modified_at = ?
-                        WHERE conversation_id = ?
-                    """, (active_task_id, conversation_data_str, last_modified_at, conversation_id))
-                    self.logger.debug(f"Updated conversation: {conversation_id}")
-                else:
-                    # Insert new
-                    conn.execute("""
-                        INSERT OR IGNORE INTO agent_conversations 
-                        (conversation_id, active_task_id, conversation_data, last_modified_at)
-                        VALUES (?, ?, ?, ?)
-                    """, (conversation_id, active_task_id, conversation_data_str, last_modified_at))
-                    self.logger.debug(f"Inserted conversation: {conversation_id}")
-                
-                conn.commit()
-            
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to import conversation data: {e}")
-            raise
-    
-    def import_from_csv(self, file_path: str, overwrite_existing: bool = False) -> ImportResult:
-        """Import conversations from CSV export file"""
+    def read_csv(self, file_path: str) -> Tuple[ImportResult, List[Dict[str, Any]]]:
+        """Read the conversations of a CSV export file without writing them"""
         result = ImportResult(success=False)
+        conversations = []
         
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
@@ -280,23 +335,71 @@ class ImportManager:
                             # Keep as string if not valid JSON
                             self.logger.debug(f"CSV data not valid JSON, keeping as string: {e}")
                         
-                        success = self._import_conversation_data(conv_data, overwrite_existing)
-                        if success:
-                            result.imported_count += 1
-                        else:
-                            result.skipped_count += 1
+                        conversations.append(conv_data)
                             
                     except Exception as e:
                         result.add_error(f"Failed to import CSV row: {e}")
             
             result.success = True
-            self.logger.info(f"CSV import completed: {result.imported_count} imported, {result.skipped_count} skipped")
             
         except Exception as e:
             result.add_error(f"Failed to process CSV file: {e}")
             self.logger.error(f"CSV import failed: {e}")
         
-        return result
+        return result, conversations
+    
+    def _import_conversation_data(self, conv_data: Dict[str, Any], overwrite_existing: bool) -> bool:
+        """Import a single conversation into the database"""
+        try:
+            conversation_id = conv_data.get('conversation_id')
+            if not conversation_id:
+                raise ValueError("Missing conversation_id")
+            
+            with self._write_lock:
+                # Check if conversation already exists
+                existing_conv = self.db_manager.get_conversation_by_id(conversation_id)
+                
+                if existing_conv and not overwrite_existing:
+                    self.logger.debug(f"Skipping existing conversation: {conversation_id}")
+                    return False
+                
+                # Prepare conversation data
+                active_task_id = conv_data.get('active_task_id')
+                last_modified_at = conv_data.get('last_modified_at', datetime.now().isoformat())
+                
+                # Handle conversation_data - could be already parsed or raw JSON string
+                conversation_data = conv_data.get('conversation_data', {})
+                if isinstance(conversation_data, str):
+                    conversation_data_str = conversation_data
+                else:
+                    conversation_data_str = json.dumps(conversation_data, ensure_ascii=False)
+                
+                # Insert or update in database
+                with self.db_manager.get_connection() as conn:
+                    if existing_conv and overwrite_existing:
+                        # Update existing
+                        conn.execute("""
+                            UPDATE agent_conversations 
+                            SET active_task_id = ?, conversation_data = ?, last_modified_at = ?
+                            WHERE conversation_id = ?
+                        """, (active_task_id, conversation_data_str, last_modified_at, conversation_id))
+                        self.logger.debug(f"Updated conversation: {conversation_id}")
+                    else:
+                        # Insert new
+                        conn.execute("""
+                            INSERT OR IGNORE INTO agent_conversations 
+                            (conversation_id, active_task_id, conversation_data, last_modified_at)
+                            VALUES (?, ?, ?, ?)
+                        """, (conversation_id, active_task_id, conversation_data_str, last_modified_at))
+                        self.logger.debug(f"Inserted conversation: {conversation_id}")
+                    
+                    conn.commit()
+            
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to import conversation data: {e}")
+            raise
     
     def merge_databases(self, source_db_path: str, overwrite_existing: bool = False) -> ImportResult:
         """Merge conversations from another Warp database"""
@@ -6,22 +6,60 @@ Provides safe path validation and input sanitization
 
 import os
 import re
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import Optional, Set, Union
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Directory traversal sequences (start, middle or end of the path).
+# A single alternation without nested quantifiers, so matching is linear.
+_TRAVERSAL_RE = re.compile(r'\.\.[\\/]|[\\/]\.\.$')
+
+# Anything that is not alphanumeric, whitespace, dot, hyphen or underscore
+_SAFE_FILENAME_RE = re.compile(r'[^\w\s.-]')
+
+# Same rule as a str.translate table for the ASCII range
+_SAFE_FILENAME_TABLE = {i: '_' for i in range(128) if _SAFE_FILENAME_RE.match(chr(i))}
+
+# Export directories already ensured by validate_export_path in this process
+_CREATED_DIRS: Set[Path] = set()
+
+# Reserved device names on Windows (none longer than 4 characters)
+_RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
 
 class SecurityError(Exception):
     """Custom exception for security-related errors"""
     pass
 
 
+@lru_cache(maxsize=32)
+def _resolved_base(base_dir: str) -> str:
+    """Resolve an absolute base directory once; bulk exports reuse the same one per file"""
+    return os.path.realpath(base_dir)
+
+
+def _is_within(path: str, base: str) -> bool:
+    """Check whether a normalized path lies inside base (or is base itself)"""
+    try:
+        return os.path.commonpath([path, base]) == base
+    except ValueError:
+        # Different drives, or mixing absolute and relative paths
+        return False
+
+
 def safe_path(user_path: Union[str, Path], 
               base_dir: Optional[Union[str, Path]] = None,
               allow_absolute: bool = True,
-              must_exist: bool = False) -> Path:
+              must_exist: bool = False,
+              resolve: bool = True) -> Path:
     """
     Validate and sanitize a user-provided path to prevent directory traversal attacks.
     
@@ -30,6 +68,8 @@ def safe_path(user_path: Union[str, Path],
         base_dir: Base directory to restrict paths to (optional)
         allow_absolute: Whether to allow absolute paths
         must_exist: Whether the path must exist
+        resolve: Whether to return the canonical path with symlinks resolved;
+            without it, an absolute path is only normalized
         
     Returns:
         Validated Path object
@@ -38,63 +78,80 @@ def safe_path(user_path: Union[str, Path],
         SecurityError: If path validation fails
         FileNotFoundError: If must_exist=True and path doesn't exist
     """
+    # Validation works on plain strings with os.path; a Path is only
+    # built for the return value. Path inputs come from our own code
+    # and skip the string-level checks.
+    if isinstance(user_path, Path):
+        path = os.fspath(user_path)
+    elif not isinstance(user_path, str):
+        raise SecurityError(f"Invalid path type: {type(user_path).__name__}")
+    else:
+        # Basic input sanitization, failing fast before any regex work
+        if len(user_path) > 1000:  # Reasonable path length limit
+            raise SecurityError("Path too long")
+        
+        # Check for suspicious patterns; the substring test rules out
+        # almost every real path before the regex engine runs
+        if '..' in user_path and _TRAVERSAL_RE.search(user_path):
+            raise SecurityError(f"Potential directory traversal detected: {user_path}")
+        
+        path = user_path
+    
+    # The OS would reject or truncate at a NUL byte; fail before any filesystem call
+    if '\0' in path:
+        raise SecurityError("Invalid path: embedded null byte")
+    
+    # Reject symlinks before resolving, since realpath() would follow them
+    st: Optional[os.stat_result]
+    try:
+        st = os.lstat(path)
+    except (OSError, ValueError):
+        st = None
+    if st is not None and stat.S_ISLNK(st.st_mode):
+        raise SecurityError(f"Symlink rejected: {user_path}")
+    
+    # Resolve to absolute path (this handles .. and . components).
+    # Callers that don't need the canonical path may skip realpath for
+    # absolute paths without '..', unless a base directory comparison or
+    # existence check requires it.
     try:
-        # Convert to Path object and resolve
-        if isinstance(user_path, str):
-            # Basic input sanitization
-            if len(user_path) > 1000:  # Reasonable path length limit
-                raise SecurityError("Path too long")
-            
-            # Check for suspicious patterns
-            suspicious_patterns = [
-                r'\.\.[\\/]',  # Directory traversal
-                r'[\\/]\.\.[\\/]',  # Directory traversal in middle
-                r'[\\/]\.\.$',  # Directory traversal at end
-                r'^\.\.[\\/]',  # Directory traversal at start
-            ]
-            
-            for pattern in suspicious_patterns:
-                if re.search(pattern, user_path):
-                    raise SecurityError(f"Potential directory traversal detected: {user_path}")
-            
-            path = Path(user_path)
+        if (not resolve and os.path.isabs(path) and '..' not in path.replace('\\', '/').split('/')
+                and not base_dir and not must_exist):
+            resolved = os.path.normpath(path)
         else:
-            path = user_path
-        
-        # Resolve to absolute path (this handles .. and . components)
+            resolved = os.path.realpath(path)
+    except (OSError, ValueError) as e:
+        raise SecurityError(f"Invalid path: {e}")
+    
+    # Check if absolute paths are allowed
+    if not allow_absolute and os.path.isabs(resolved):
+        # For relative paths, convert back to relative from current directory
         try:
-            resolved_path = path.resolve()
-        except (OSError, ValueError) as e:
+            cwd = os.getcwd()
+        except OSError as e:
             raise SecurityError(f"Invalid path: {e}")
-        
-        # Check if absolute paths are allowed
-        if not allow_absolute and resolved_path.is_absolute():
-            # For relative paths, convert back to relative from current directory
-            try:
-                resolved_path = resolved_path.relative_to(Path.cwd())
-            except ValueError:
-                raise SecurityError("Path outside current directory not allowed")
-        
-        # Check base directory restriction
-        if base_dir:
-            base_path = Path(base_dir).resolve()
-            try:
-                resolved_path.relative_to(base_path)
-            except ValueError:
-                raise SecurityError(f"Path outside allowed directory: {base_path}")
-        
-        # Check existence if required
-        if must_exist and not resolved_path.exists():
-            raise FileNotFoundError(f"Path does not exist: {resolved_path}")
-        
+        if not _is_within(resolved, cwd):
+            raise SecurityError("Path outside current directory not allowed")
+        resolved = os.path.relpath(resolved, cwd)
+    
+    # Check base directory restriction
+    if base_dir:
+        try:
+            # Keyed on the absolute path, so a relative base still follows chdir
+            base = _resolved_base(os.path.abspath(os.fspath(base_dir)))
+        except (OSError, ValueError) as e:
+            raise SecurityError(f"Invalid base directory: {e}")
+        if not _is_within(resolved, base):
+            raise SecurityError(f"Path outside allowed directory: {base}")
+    
+    # Check existence if required
+    if must_exist and not os.path.exists(resolved):
+        raise FileNotFoundError(f"Path does not exist: {resolved}")
+    
+    resolved_path = Path(resolved)
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(f"Path validation successful: {user_path} -> {resolved_path}")
-        return resolved_path
-        
-    except SecurityError:
-        raise
-    except Exception as e:
-        logger.error(f"Unexpected error in path validation: {e}")
-        raise SecurityError(f"Path validation failed: {e}")
+    return resolved_path
 
 
 def safe_filename(filename: str, max_length: int = 255) -> str:
@@ -114,21 +171,24 @@ def safe_filename(filename: str, max_length: int = 255) -> str:
     if not filename or not isinstance(filename, str):
         raise SecurityError("Invalid filename")
     
+    return _sanitize_filename(filename, max_length)
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_filename(filename: str, max_length: int) -> str:
+    """Pure sanitization step of safe_filename, memoized for repeated exports"""
     # Remove or replace dangerous characters
     # Keep alphanumeric, dots, hyphens, underscores, spaces
-    sanitized = re.sub(r'[^\w\s.-]', '_', filename)
+    sanitized = filename.translate(_SAFE_FILENAME_TABLE)
+    if not sanitized.isascii():
+        sanitized = _SAFE_FILENAME_RE.sub('_', sanitized)
     
     # Remove leading/trailing whitespace and dots
     sanitized = sanitized.strip('. ')
     
-    # Check for reserved names (Windows)
-    reserved_names = {
-        'CON', 'PRN', 'AUX', 'NUL',
-        'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
-        'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
-    }
-    
-    if sanitized.upper() in reserved_names:
+    # Check for reserved names (Windows), which also apply with an extension
+    stem = sanitized.split('.', 1)[0]
+    if len(stem) <= 4 and stem.upper() in _RESERVED_NAMES:
         sanitized = f"file_{sanitized}"
     
     # Enforce length limit
@@ -144,7 +204,8 @@ def safe_filename(filename: str, max_length: int = 255) -> str:
     if not sanitized:
         raise SecurityError("Filename becomes empty after sanitization")
     
-    logger.debug(f"Filename sanitized: {filename} -> {sanitized}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Filename sanitized: {filename} -> {sanitized}")
     return sanitized
 
 
@@ -165,17 +226,27 @@ def validate_export_path(export_path: str, base_export_dir: Optional[str] = None
             export_path,
             base_dir=base_export_dir,
             allow_absolute=True,
-            must_exist=False
+            must_exist=False,
+            # Bulk exports validate one path per file; the canonical form
+            # adds nothing when there is no base directory to compare with
+            resolve=False
         )
         
-        # Ensure parent directory exists or can be created
+        # Ensure parent directory exists or can be created; directories seen
+        # before only get a cheap check, since they may have been removed or
+        # replaced since
         parent_dir = safe_export_path.parent
-        if not parent_dir.exists():
+        if parent_dir in _CREATED_DIRS and not os.path.isdir(parent_dir):
+            _CREATED_DIRS.discard(parent_dir)
+        if parent_dir not in _CREATED_DIRS:
             try:
                 parent_dir.mkdir(parents=True, exist_ok=True)
-                logger.info(f"Created export directory: {parent_dir}")
             except OSError as e:
                 raise SecurityError(f"Cannot create export directory: {e}")
+            # Only a real directory may be remembered as ensured
+            if not parent_dir.is_dir():
+                raise SecurityError(f"Export directory is not a directory: {parent_dir}")
+            _CREATED_DIRS.add(parent_dir)
         
         return safe_export_path
         
@@ -195,20 +266,28 @@ def validate_import_path(import_path: str) -> Path:
         Validated import path
     """
     try:
-        # Import files must exist
+        # Imports are opened from the canonical path, never a symlinked one
         safe_import_path = safe_path(
             import_path,
             allow_absolute=True,
-            must_exist=True
+            resolve=True
         )
         
+        # Import files must exist; a single stat covers existence, type and size
+        try:
+            st = os.stat(safe_import_path)
+        except FileNotFoundError:
+            raise SecurityError(f"Path does not exist: {safe_import_path}")
+        except (OSError, ValueError) as e:
+            raise SecurityError(f"Cannot access import file: {e}")
+        
         # Additional checks for import files
-        if not safe_import_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             raise SecurityError("Import path must be a file")
         
         # Check file size (reasonable limit: 1GB)
         max_file_size = 1024 * 1024 * 1024  # 1GB
-        if safe_import_path.stat().st_size > max_file_size:
+        if st.st_size > max_file_size:
             raise SecurityError(f"Import file too large (max {max_file_size} bytes)")
         
         return safe_import_path
@@ -29,6 +29,18 @@ def get_version():
         exec(fh.read(), version)
     return version.get("__version__", "1.0.0")
 
+# Optionally compile the path validation hot path with mypyc
+# (WARP_ARCHIVER_MYPYC=1); source installs keep the pure-Python module
+def get_ext_modules():
+    if os.environ.get("WARP_ARCHIVER_MYPYC") != "1":
+        return []
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print("mypyc not installed, building pure-Python package", file=sys.stderr)
+        return []
+    return mypycify(["security_utils.py"])
+
 setup(
     name="warp-chat-archiver",
     version=get_version(),
@@ -39,6 +51,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/runlvl/warp-chat-archiver",
     packages=find_packages(),
+    ext_modules=get_ext_modules(),
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
@@ -6,6 +6,8 @@ Run with: python -m pytest tests/
 
 import sys
 import os
+import importlib.util
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch, MagicMock
@@ -16,6 +18,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import database_manager
 import export_manager
 import backup_manager
+import import_manager
+import security_utils
 
 
 class TestDatabaseManager(unittest.TestCase):
@@ -35,6 +39,32 @@ class TestDatabaseManager(unittest.TestCase):
         # Should not raise exception and return empty list
         conversations = db.get_all_conversations()
         self.assertIsInstance(conversations, list)
+    
+    def test_database_manager_missing_count_and_iter(self):
+        """Test that missing database yields no rows and a zero count"""
+        db = database_manager.WarpDatabaseManager(db_path="/nonexistent/warp.sqlite", allow_missing=True)
+        self.assertEqual(db.get_conversation_count(), 0)
+        self.assertEqual(list(db.iter_conversations(limit=5)), [])
+        self.assertEqual(db.get_conversations_paged(500, 0), [])
+        self.assertEqual(db.get_all_conversation_ids(), set())
+    
+    def test_conversations_by_date_range_includes_end_date(self):
+        """Test that both ends of the date range are inclusive"""
+        import sqlite3
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, 'warp.sqlite')
+            conn = sqlite3.connect(db_path)
+            conn.execute("""CREATE TABLE agent_conversations (id INTEGER PRIMARY KEY,
+                conversation_id TEXT, active_task_id TEXT, conversation_data TEXT, last_modified_at TEXT)""")
+            for i, ts in enumerate(['2025-01-14 23:59:59', '2025-01-15 00:00:00',
+                                    '2025-01-16 23:59:59', '2025-01-17 00:00:00']):
+                conn.execute("INSERT INTO agent_conversations VALUES (?, ?, NULL, '{}', ?)", (i, f'c{i}', ts))
+            conn.commit()
+            conn.close()
+            
+            db = database_manager.WarpDatabaseManager(db_path=db_path)
+            found = db.get_conversations_by_date_range('2025-01-15', '2025-01-16')
+        self.assertEqual([c.conversation_id for c in found], ['c2', 'c1'])
 
 
 class TestExportManager(unittest.TestCase):
@@ -69,6 +99,21 @@ class TestExportManager(unittest.TestCase):
                 "/tmp/test_export.json"
             )
             mock_export.assert_called_once()
+    
+    def test_export_to_json_writes_valid_document(self):
+        """Test that the streamed JSON export parses back"""
+        import json
+        conv = database_manager.ChatConversation(
+            id=1, conversation_id='test-123', active_task_id=None,
+            conversation_data='{"todo_lists": []}', last_modified_at='2025-01-15 10:00:00'
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, 'export.json')
+            self.assertTrue(export_manager.ExportManager().export_to_json([conv, conv], output))
+            with open(output, encoding='utf-8') as f:
+                data = json.load(f)
+        self.assertEqual(data['total_conversations'], 2)
+        self.assertEqual([c['conversation_id'] for c in data['conversations']], ['test-123', 'test-123'])
 
 
 class TestBackupManager(unittest.TestCase):
@@ -93,6 +138,162 @@ class TestBackupManager(unittest.TestCase):
             mock_mkdir.assert_called_with(parents=True, exist_ok=True)
 
 
+class TestImportManager(unittest.TestCase):
+    """Test import helpers"""
+    
+    def test_iter_json_conversations_streams_items(self):
+        """Test that conversations are read across small chunks"""
+        import io
+        import json
+        data = {
+            'export_info': {'note': '"conversations": ['},
+            'conversations': [{'conversation_id': f'c{i}'} for i in range(5)],
+            'total_conversations': 5
+        }
+        with patch.object(import_manager, 'JSON_STREAM_CHUNK', 4):
+            items = list(import_manager.iter_json_conversations(io.StringIO(json.dumps(data))))
+        self.assertEqual(items, data['conversations'])
+    
+    def test_read_compressed_sqlite_backup_then_store(self):
+        """Test reading a .sqlite.gz backup and storing it without duplicates"""
+        import gzip
+        import shutil
+        import sqlite3
+        schema = """CREATE TABLE agent_conversations (id INTEGER PRIMARY KEY,
+            conversation_id TEXT, active_task_id TEXT, conversation_data TEXT, last_modified_at TEXT)"""
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, 'source.sqlite')
+            conn = sqlite3.connect(source)
+            conn.execute(schema)
+            conn.execute("INSERT INTO agent_conversations VALUES (1, 'c1', NULL, '{}', '2025-01-15 10:00:00')")
+            conn.commit()
+            conn.close()
+            backup = os.path.join(tmp, 'warp_backup.sqlite.gz')
+            with open(source, 'rb') as f_in, gzip.open(backup, 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out)
+            
+            target = os.path.join(tmp, 'warp.sqlite')
+            conn = sqlite3.connect(target)
+            conn.execute(schema)
+            conn.close()
+            
+            manager = import_manager.ImportManager(database_manager.WarpDatabaseManager(db_path=target))
+            for _ in range(2):
+                result, conversations = manager.read_backup(backup)
+                result = manager.store_conversations(result, conversations, False)
+            
+            self.assertTrue(result.success)
+            self.assertEqual((result.imported_count, result.skipped_count), (0, 1))
+            self.assertEqual(sorted(os.listdir(tmp)), ['source.sqlite', 'warp.sqlite', 'warp_backup.sqlite.gz'])
+
+
+class TestSecurityUtils(unittest.TestCase):
+    """Test path and filename sanitization"""
+    
+    def test_safe_filename_replaces_unsafe_characters(self):
+        """Test that unsafe characters are replaced"""
+        self.assertEqual(security_utils.safe_filename("test<>file.txt"), "test__file.txt")
+    
+    def test_safe_filename_prefixes_reserved_names(self):
+        """Test that Windows reserved names are prefixed"""
+        self.assertEqual(security_utils.safe_filename("con"), "file_con")
+        self.assertEqual(security_utils.safe_filename("LPT1.txt"), "file_LPT1.txt")
+        self.assertEqual(security_utils.safe_filename("console.txt"), "console.txt")
+    
+    def test_safe_path_detects_traversal(self):
+        """Test that directory traversal is rejected"""
+        for path in ("../../../etc/passwd", "exports/../secret", "exports/.."):
+            with self.assertRaises(security_utils.SecurityError):
+                security_utils.safe_path(path)
+    
+    def test_safe_path_rejects_null_byte(self):
+        """Test that embedded NUL bytes are rejected on every path"""
+        for kwargs in ({}, {'resolve': False}):
+            with self.assertRaises(security_utils.SecurityError):
+                security_utils.safe_path("/tmp/a\0b", **kwargs)
+    
+    @unittest.skipUnless(hasattr(os, 'symlink'), "symlinks not supported")
+    def test_safe_path_resolves_symlinked_parent(self):
+        """Test that a symlinked parent directory is resolved by default"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            real_dir = Path(tmp_dir).resolve() / "real"
+            real_dir.mkdir()
+            link_dir = Path(tmp_dir).resolve() / "link"
+            try:
+                os.symlink(real_dir, link_dir)
+            except OSError:
+                self.skipTest("cannot create symlinks")
+            
+            self.assertEqual(security_utils.safe_path(str(link_dir / "export.json")), real_dir / "export.json")
+    
+    def test_safe_path_relative_base_follows_cwd(self):
+        """Test that a relative base directory is resolved against the current directory"""
+        cwd = os.getcwd()
+        try:
+            for _ in range(2):
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    tmp_dir = os.path.realpath(tmp_dir)
+                    os.mkdir(os.path.join(tmp_dir, "exports"))
+                    os.chdir(tmp_dir)
+                    export_file = os.path.join(tmp_dir, "exports", "export.json")
+                    self.assertEqual(security_utils.safe_path(export_file, base_dir="exports"), Path(export_file))
+                    os.chdir(cwd)
+        finally:
+            os.chdir(cwd)
+    
+    @unittest.skipUnless(hasattr(os, 'symlink'), "symlinks not supported")
+    def test_safe_path_rejects_symlink(self):
+        """Test that a symlinked path is rejected before resolution"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            target = Path(tmp_dir) / "target.json"
+            target.write_text("{}")
+            link = Path(tmp_dir) / "link.json"
+            try:
+                os.symlink(target, link)
+            except OSError:
+                self.skipTest("cannot create symlinks")
+            
+            with self.assertRaises(security_utils.SecurityError):
+                security_utils.safe_path(str(link))
+            self.assertEqual(security_utils.safe_path(str(target)), target)
+    
+    def test_validate_import_path(self):
+        """Test that import paths must be existing regular files"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            import_file = Path(tmp_dir).resolve() / "export.json"
+            import_file.write_text("{}")
+            
+            self.assertEqual(security_utils.validate_import_path(str(import_file)), import_file)
+            with self.assertRaises(security_utils.SecurityError):
+                security_utils.validate_import_path(tmp_dir)
+            with self.assertRaises(security_utils.SecurityError):
+                security_utils.validate_import_path(str(Path(tmp_dir) / "missing.json"))
+            with self.assertRaises(security_utils.SecurityError):
+                security_utils.validate_import_path(str(import_file / "nested.json"))
+    
+    def test_validate_export_path_creates_parent(self):
+        """Test that missing export directories are created"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            export_file = Path(tmp_dir).resolve() / "nested" / "export.json"
+            
+            self.assertEqual(security_utils.validate_export_path(str(export_file)), export_file)
+            self.assertTrue(export_file.parent.is_dir())
+            
+            # A directory removed after it was first ensured is created again
+            export_file.parent.rmdir()
+            security_utils.validate_export_path(str(export_file))
+            self.assertTrue(export_file.parent.is_dir())
+    
+    def test_validate_export_path_rejects_file_as_parent(self):
+        """Test that a file in place of the export directory is rejected"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            blocker = Path(tmp_dir).resolve() / "blocker"
+            blocker.write_text("")
+            
+            with self.assertRaises(security_utils.SecurityError):
+                security_utils.validate_export_path(str(blocker / "export.json"))
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests"""
     
@@ -107,8 +308,7 @@ class TestIntegration(unittest.TestCase):
         modules = [
             'database_manager',
             'export_manager', 
-            'backup_manager',
-            'warp_archiver_gui'
+            'backup_manager'
         ]
         
         for module_name in modules:
@@ -116,6 +316,10 @@ class TestIntegration(unittest.TestCase):
                 __import__(module_name)
             except ImportError as e:
                 self.fail(f"Failed to import {module_name}: {e}")
+        
+        # Locate the GUI module without executing it, so unit tests don't
+        # pull in tkinter (CI imports it separately on Linux)
+        self.assertIsNotNone(importlib.util.find_spec('warp_archiver_gui'))
 
 
 if __name__ == '__main__':
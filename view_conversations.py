@@ -7,34 +7,41 @@ View Warp conversation contents in terminal
 import sys
 from database_manager import WarpDatabaseManager
 
+_SEP = '=' * 80
+_SUB = '-' * 80
+
 def main():
     try:
         db_manager = WarpDatabaseManager()
-        conversations = db_manager.get_all_conversations()
+        total = db_manager.get_conversation_count()
         
-        print(f"🗣️  Found {len(conversations)} conversations\n")
+        print(f"🗣️  Found {total} conversations\n")
         
-        for i, conv in enumerate(conversations[:5], 1):  # Show first 5
-            print(f"{'='*80}")
-            print(f"CONVERSATION {i}/{len(conversations)}")
-            print(f"{'='*80}")
-            print(f"ID: {conv.conversation_id}")
-            print(f"Date: {conv.last_modified_at}")
-            print(f"Summary: {conv.get_summary()}")
-            print(f"\n📋 CONTENT:")
-            print(f"{'-'*80}")
-            
-            content = conv.get_readable_content()
-            print(content)
-            
-            print(f"\n{'='*80}\n")
+        # Fetch only the rows we show; materialized so no read transaction
+        # stays open on Warp's database while waiting for input
+        conversations = list(db_manager.iter_conversations(limit=5))
+        
+        for i, conv in enumerate(conversations, 1):
+            # One write per conversation instead of a print() per line
+            sys.stdout.write(
+                f"{_SEP}\n"
+                f"CONVERSATION {i}/{total}\n"
+                f"{_SEP}\n"
+                f"ID: {conv.conversation_id}\n"
+                f"Date: {conv.last_modified_at}\n"
+                f"Summary: {conv.get_summary()}\n"
+                f"\n📋 CONTENT:\n"
+                f"{_SUB}\n"
+                f"{conv.get_readable_content()}\n"
+                f"\n{_SEP}\n\n"
+            )
             
-            if i < 5 and len(conversations) > 1:
+            if i < 5 and total > 1:
                 input("Press Enter to see next conversation...")
                 print()
         
-        if len(conversations) > 5:
-            print(f"... and {len(conversations) - 5} more conversations.")
+        if total > 5:
+            print(f"... and {total - 5} more conversations.")
             print("Use the GUI application to see all conversations.")
             
     except Exception as e:
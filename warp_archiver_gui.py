@@ -7,22 +7,103 @@ User-friendly interface for managing Warp chat archives
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext, font
 import threading
+import queue
+import concurrent.futures
+import itertools
+import time
 import json
+import gzip
+import hashlib
 import os
+import platform
+import re
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
+from dataclasses import dataclass
+from collections import deque
+from enum import Enum
 import logging
 
 from database_manager import WarpDatabaseManager, ChatConversation
 from export_manager import ExportManager
 from backup_manager import BackupManager, BackupConfig, BackupInfo
-from import_manager import ImportManager, ImportResult
+from import_manager import ImportManager, ImportResult, iter_json_conversations
+
+@dataclass
+class _ConvView:
+    """Treeview values and search text for one conversation"""
+    __slots__ = ('date', 'cid', 'summary', 'messages', 'haystack', 'values')
+    date: str
+    cid: str
+    summary: str
+    messages: str
+    haystack: str
+    
+    def __post_init__(self):
+        # Built once so rendering hands Tcl the same tuple every time
+        self.values = (self.date, self.cid, self.summary, self.messages)
+
+
+# Bytes per mebibyte, for the sizes shown in MB
+MiB = 1 << 20
+
+# Characters of conversation content shown in the preview at a time
+PREVIEW_CHUNK_SIZE = 64 * 1024
+
+# How often callbacks posted by worker threads are run on the Tk thread
+UI_POLL_INTERVAL_MS = 16
+
+# Minimum seconds between progress messages of a running batch
+STATUS_UPDATE_INTERVAL = 0.1
+
+# Upper bound on files imported at once by batch import
+BATCH_IMPORT_WORKERS = 8
+
+# Operating system name; platform.system() runs uname on every call
+_SYSTEM = platform.system()
+
+# Monospace font for text previews, looked up once per process
+_MONO_FONT = None
+
+
+def _mono_font(root) -> tuple:
+    """Pick the monospace font, enumerating installed fonts only once"""
+    global _MONO_FONT
+    if _MONO_FONT is None:
+        _MONO_FONT = ('Consolas', 10) if 'Consolas' in set(font.families(root)) else ('Courier', 10)
+    return _MONO_FONT
+
+
+class ImportKind(Enum):
+    """File formats accepted by the import tab"""
+    JSON = "JSON Export"
+    SQLITE = "SQLite Database"
+    CSV = "CSV Export"
+    UNKNOWN = "Unknown"
+
+
+# Final import extension; JSON and SQLite may be gzipped, CSV may not
+_IMPORT_EXT_RE = re.compile(r'\.(json|sqlite)(?:\.gz)?$|\.(csv)$', re.IGNORECASE)
+
+_IMPORT_KINDS = {'json': ImportKind.JSON, 'sqlite': ImportKind.SQLITE, 'csv': ImportKind.CSV}
+
+
+def _detect_import_kind(path: str) -> ImportKind:
+    """Classify an import file by its final extension (looking past .gz)"""
+    match = _IMPORT_EXT_RE.search(path)
+    if not match:
+        return ImportKind.UNKNOWN
+    return _IMPORT_KINDS[(match.group(1) or match.group(2)).lower()]
 
 
 class WarpArchiverGUI:
     """Main GUI application for Warp Chat Archiver"""
     
+    CONFIG_PATH = Path.home() / ".warp-chat-archiver-config.json"
+    DEFAULT_BACKUP_DIR = str(Path.home() / "warp-chat-backups")
+    DEFAULT_EXPORT_DIR = str(Path.home() / "warp_exports")
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Warp Chat Archiver")
@@ -32,15 +113,43 @@ class WarpArchiverGUI:
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         
+        # User actions (imports, exports, backups) share a small thread pool; created
+        # first, since run() shuts it down even if initialization fails
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="warp-archiver")
+        # Set when the window closes; queued actions are then dropped
+        self._closing = threading.Event()
+        
         # Initialize managers
         try:
             self.db_manager = WarpDatabaseManager()
             self.export_manager = ExportManager()
+            # Single-file exporters by format (also the file extension)
+            self._single_exporters = {
+                "json": self.export_manager.export_to_json,
+                "md": self.export_manager.export_to_markdown,
+                "html": self.export_manager.export_to_html,
+                "csv": self.export_manager.export_to_csv,
+            }
             self.import_manager = ImportManager(self.db_manager)
+            # Unknown files fall back to import_from_backup's own detection
+            self._import_dispatch = {
+                ImportKind.JSON: self.import_manager.import_from_json,
+                ImportKind.SQLITE: self.import_manager.import_from_backup,
+                ImportKind.CSV: self.import_manager.import_from_csv,
+                ImportKind.UNKNOWN: self.import_manager.import_from_backup,
+            }
+            # Readers only, for batch import, which stores each file's conversations itself
+            self._read_dispatch = {
+                ImportKind.JSON: self.import_manager.read_json,
+                ImportKind.SQLITE: self.import_manager.read_backup,
+                ImportKind.CSV: self.import_manager.read_csv,
+                ImportKind.UNKNOWN: self.import_manager.read_backup,
+            }
             
             # Default backup config
             self.backup_config = BackupConfig(
-                backup_dir=str(Path.home() / "warp-chat-backups"),
+                backup_dir=self.DEFAULT_BACKUP_DIR,
                 enable_compression=True,
                 retention_days=30,
                 max_backups=10
@@ -56,9 +165,84 @@ class WarpArchiverGUI:
         self.conversations: List[ChatConversation] = []
         self.filtered_conversations: List[ChatConversation] = []
         self.selected_conversations: List[ChatConversation] = []
+        self._by_id: Dict[str, ChatConversation] = {}
+        
+        # Virtualized conversations list: only the rows in the viewport exist
+        # in the treeview; a pool of item ids is reused as the view scrolls
+        self._filtered_views: List[_ConvView] = []
+        self._view_offset = 0
+        self._visible_rows = 15
+        self._row_pool: List[str] = []
+        self._rendered_rows: Dict[str, int] = {}
+        self._row_metrics: Optional[tuple] = None
+        self._selected_ids: set = set()
+        self._selection_echo: Optional[tuple] = None
+        self._extend_selection = False
+        
+        # Pending debounced search, if any, and whether the last one matched nothing
+        self._search_after_id: Optional[str] = None
+        self._search_token = 0
+        self._search_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._last_filter_was_empty = False
+        
+        # Row views parallel to self.conversations, plus the same views by
+        # (conversation_id, last_modified_at) for reuse on reload
+        self._views: List[_ConvView] = []
+        self._view_cache: Dict[tuple, _ConvView] = {}
+        self._stale_views: Dict[tuple, _ConvView] = {}
+        
+        # Bumped on every load so pages from a superseded load are dropped
+        self._load_generation = 0
+        
+        # Statistics keyed by a modification stamp of their source
+        self._stats_cache: Dict[str, tuple] = {}
+        
+        # Digest, mtime and size of the configuration file as last read or
+        # written, so saving unchanged settings skips the disk while the file
+        # is untouched; only used by the worker
+        self._config_state: Optional[tuple] = None
+        
+        # Values currently shown in the backup history, by filename
+        self._backup_rows: Dict[str, tuple] = {}
+        
+        # Log lines waiting to be appended, per text widget
+        self._log_buffers: Dict[Any, List[str]] = {}
+        
+        # Import validation results keyed by file content, see _import_cache_key
+        self._import_validation_cache: Dict[bytes, tuple] = {}
+        # Conversation ids in the database, read on first preview and dropped
+        # whenever an import, merge or refresh may have changed them
+        self._existing_ids: Optional[Set[str]] = None
+        # Last date range query and its result, dropped on the same events
+        self._date_range_cache: Optional[tuple] = None
+        # Backup directory string and the Path built from it
+        self._backup_dir_cache: Optional[tuple] = None
+        
+        # Content of the previewed conversation not yet shown, the conversation
+        # itself, and the selection label text currently displayed
+        self._preview_tail = ""
+        self._previewed: Optional[ChatConversation] = None
+        self._selection_text: Optional[str] = None
+        
+        # Running tasks, see start_progress
+        self._progress_tokens = itertools.count()
+        self._active_progress: set = set()
+        self._progress_visible = False
+        
+        # One persistent worker runs database and file tasks in order, so
+        # repeated refreshes queue up instead of racing each other
+        self._work_q: queue.Queue = queue.Queue()
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+        self._load_queued = False
+        
+        # Callbacks posted by worker threads, run by one poller on the Tk thread
+        self._ui_q: queue.Queue = queue.Queue()
         
         # Create GUI
         self.create_widgets()
+        self._poll_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.load_conversations()
         
         # Load configuration
@@ -71,13 +255,23 @@ class WarpArchiverGUI:
         self.notebook = ttk.Notebook(self.root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # Create tabs
+        # Variables shared between tabs and the configuration
+        self.create_variables()
+        
+        # Create tabs; all but the first are built when first shown
         self.create_conversations_tab()
-        self.create_export_tab()
-        self.create_import_tab()
-        self.create_backup_tab()
-        self.create_settings_tab()
-        self.create_statistics_tab()
+        
+        self._tab_builders = {}
+        for text, builder in (("Export", self.create_export_tab),
+                              ("Import", self.create_import_tab),
+                              ("Backup", self.create_backup_tab),
+                              ("Settings", self.create_settings_tab),
+                              ("Statistics", self.create_statistics_tab)):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=text)
+            self._tab_builders[str(frame)] = (builder, frame)
+        
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         
         # Status bar
         self.status_bar = ttk.Frame(self.root)
@@ -89,6 +283,34 @@ class WarpArchiverGUI:
         self.progress_bar = ttk.Progressbar(self.status_bar, mode='indeterminate')
         self.progress_bar.pack(side=tk.RIGHT, padx=(10, 0))
     
+    def create_variables(self):
+        """Create the Tk variables behind the export, import, backup and settings tabs"""
+        self.export_format_var = tk.StringVar(value="json")
+        self.export_mode_var = tk.StringVar(value="single")
+        self.export_all_var = tk.BooleanVar(value=True)
+        self.export_start_date_var = tk.StringVar(value=(datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d"))
+        self.export_end_date_var = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
+        self.export_path_var = tk.StringVar(value=self.DEFAULT_EXPORT_DIR)
+        self.import_file_var = tk.StringVar()
+        self.overwrite_existing_var = tk.BooleanVar(value=False)
+        self.conflict_resolution_var = tk.StringVar(value="skip")
+        self.backup_dir_var = tk.StringVar(value=self.backup_config.backup_dir)
+        self.backup_compression_var = tk.BooleanVar(value=self.backup_config.enable_compression)
+        self.retention_days_var = tk.IntVar(value=self.backup_config.retention_days)
+        self.max_backups_var = tk.IntVar(value=self.backup_config.max_backups)
+        self.backup_format_var = tk.StringVar(value=self.backup_config.backup_format)
+        self.db_path_var = tk.StringVar(value=str(self.db_manager.db_path))
+        self.log_level_var = tk.StringVar(value="INFO")
+        self.auto_refresh_var = tk.BooleanVar(value=True)
+        self.refresh_interval_var = tk.IntVar(value=30)
+    
+    def on_tab_changed(self, event):
+        """Build a tab the first time it is shown"""
+        tab = self.notebook.select()
+        if tab in self._tab_builders:
+            builder, frame = self._tab_builders.pop(tab)
+            builder(frame)
+    
     def create_conversations_tab(self):
         """Create the conversations management tab"""
         frame = ttk.Frame(self.notebook)
@@ -147,9 +369,12 @@ class WarpArchiverGUI:
             height=20, 
             wrap=tk.WORD,
             state=tk.DISABLED,
-            font=('Consolas', 10) if 'Consolas' in tk.font.families() else ('Courier', 10)
+            font=_mono_font(self.root)
         )
         self.content_preview.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.content_preview.tag_config("preview_more", foreground="gray")
+        self.content_preview.tag_bind("preview_more", "<Button-1>", self.load_more_preview)
+        self.content_preview.bind("<End>", self.load_more_preview)
         
         # Treeview for conversations
         columns = ("Date", "ID", "Summary", "Messages")
@@ -166,11 +391,12 @@ class WarpArchiverGUI:
         self.conversations_tree.column("Summary", width=300)
         self.conversations_tree.column("Messages", width=100)
         
-        # Scrollbars
-        v_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.conversations_tree.yview)
+        # Scrollbars; the vertical one scrolls the virtual list, not the widget
+        self.conversations_scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self._on_conversations_yview)
+        v_scrollbar = self.conversations_scrollbar
         h_scrollbar = ttk.Scrollbar(list_frame, orient=tk.HORIZONTAL, command=self.conversations_tree.xview)
         
-        self.conversations_tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.conversations_tree.configure(xscrollcommand=h_scrollbar.set)
         
         # Pack treeview and scrollbars
         self.conversations_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -181,6 +407,17 @@ class WarpArchiverGUI:
         self.conversations_tree.bind("<<TreeviewSelect>>", self.on_conversation_select)
         self.conversations_tree.bind("<Double-1>", self.view_conversation_details)
         
+        # Viewport tracking for the virtualized list
+        self.conversations_tree.bind("<Configure>", self._on_conversations_configure)
+        self.conversations_tree.bind("<MouseWheel>", self._on_conversations_wheel)
+        self.conversations_tree.bind("<Button-4>", self._on_conversations_wheel)
+        self.conversations_tree.bind("<Button-5>", self._on_conversations_wheel)
+        self.conversations_tree.bind("<Button-1>", self._track_selection_modifiers, add="+")
+        self.conversations_tree.bind("<KeyPress>", self._track_selection_modifiers, add="+")
+        # Only the visible rows exist as items, so the list moves the cursor itself
+        for key in ("<Up>", "<Down>", "<Prior>", "<Next>"):
+            self.conversations_tree.bind(key, self._on_conversations_key)
+        
         # Selection info frame
         selection_frame = ttk.Frame(frame)
         selection_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
@@ -197,10 +434,8 @@ class WarpArchiverGUI:
         ttk.Button(button_frame, text="View Details", command=self.view_conversation_details).pack(side=tk.LEFT, padx=(10, 0))
         ttk.Button(button_frame, text="Quick Export", command=self.quick_export_selected).pack(side=tk.RIGHT)
     
-    def create_export_tab(self):
+    def create_export_tab(self, frame: ttk.Frame):
         """Create the export tab"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Export")
         
         # Export options frame
         options_frame = ttk.LabelFrame(frame, text="Export Options")
@@ -212,7 +447,6 @@ class WarpArchiverGUI:
         
         ttk.Label(format_frame, text="Export Format:").pack(side=tk.LEFT)
         
-        self.export_format_var = tk.StringVar(value="json")
         formats = [("JSON", "json"), ("Markdown", "md"), ("HTML", "html"), ("CSV", "csv")]
         
         for text, value in formats:
@@ -224,7 +458,6 @@ class WarpArchiverGUI:
         
         ttk.Label(mode_frame, text="Export Mode:").pack(side=tk.LEFT)
         
-        self.export_mode_var = tk.StringVar(value="single")
         modes = [("Single File", "single"), ("Individual Files", "individual")]
         
         for text, value in modes:
@@ -234,7 +467,6 @@ class WarpArchiverGUI:
         date_frame = ttk.Frame(options_frame)
         date_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        self.export_all_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(date_frame, text="Export All Conversations", variable=self.export_all_var, 
                        command=self.toggle_export_date_range).pack(side=tk.LEFT)
         
@@ -242,11 +474,9 @@ class WarpArchiverGUI:
         self.export_date_frame.pack(side=tk.RIGHT)
         
         ttk.Label(self.export_date_frame, text="From:").pack(side=tk.LEFT)
-        self.export_start_date_var = tk.StringVar(value=(datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d"))
         ttk.Entry(self.export_date_frame, textvariable=self.export_start_date_var, width=12, state=tk.DISABLED).pack(side=tk.LEFT, padx=(5, 10))
         
         ttk.Label(self.export_date_frame, text="To:").pack(side=tk.LEFT)
-        self.export_end_date_var = tk.StringVar(value=datetime.now().strftime("%Y-%m-%d"))
         ttk.Entry(self.export_date_frame, textvariable=self.export_end_date_var, width=12, state=tk.DISABLED).pack(side=tk.LEFT, padx=(5, 0))
         
         # Output path
@@ -255,7 +485,6 @@ class WarpArchiverGUI:
         
         ttk.Label(path_frame, text="Output Path:").pack(side=tk.LEFT)
         
-        self.export_path_var = tk.StringVar(value=str(Path.home() / "warp_exports"))
         ttk.Entry(path_frame, textvariable=self.export_path_var, width=50).pack(side=tk.LEFT, padx=(10, 5))
         ttk.Button(path_frame, text="Browse", command=self.browse_export_path).pack(side=tk.LEFT)
         
@@ -274,10 +503,8 @@ class WarpArchiverGUI:
         self.export_log = scrolledtext.ScrolledText(log_frame, height=10, state=tk.DISABLED)
         self.export_log.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
     
-    def create_import_tab(self):
+    def create_import_tab(self, frame: ttk.Frame):
         """Create the import tab"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Import")
         
         # Import source selection frame
         source_frame = ttk.LabelFrame(frame, text="Import Source")
@@ -289,7 +516,6 @@ class WarpArchiverGUI:
         
         ttk.Label(file_frame, text="Import File:").pack(side=tk.LEFT)
         
-        self.import_file_var = tk.StringVar()
         ttk.Entry(file_frame, textvariable=self.import_file_var, width=60).pack(side=tk.LEFT, padx=(10, 5))
         ttk.Button(file_frame, text="Browse", command=self.browse_import_file).pack(side=tk.LEFT)
         ttk.Button(file_frame, text="Validate", command=self.validate_import_file).pack(side=tk.LEFT, padx=(5, 0))
@@ -310,12 +536,10 @@ class WarpArchiverGUI:
         settings_frame = ttk.Frame(options_frame)
         settings_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        self.overwrite_existing_var = tk.BooleanVar(value=False)
         ttk.Checkbutton(settings_frame, text="Overwrite existing conversations", 
                        variable=self.overwrite_existing_var).pack(side=tk.LEFT)
         
         ttk.Label(settings_frame, text="Conflicts:").pack(side=tk.LEFT, padx=(20, 5))
-        self.conflict_resolution_var = tk.StringVar(value="skip")
         conflict_options = [("Skip existing", "skip"), ("Update existing", "update"), ("Always import", "overwrite")]
         
         for text, value in conflict_options:
@@ -346,10 +570,8 @@ class WarpArchiverGUI:
         self.import_preview = scrolledtext.ScrolledText(preview_frame, height=12, state=tk.DISABLED)
         self.import_preview.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
     
-    def create_backup_tab(self):
+    def create_backup_tab(self, frame: ttk.Frame):
         """Create the backup management tab"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Backup")
         
         # Backup configuration frame
         config_frame = ttk.LabelFrame(frame, text="Backup Configuration")
@@ -360,7 +582,6 @@ class WarpArchiverGUI:
         dir_frame.pack(fill=tk.X, padx=10, pady=5)
         
         ttk.Label(dir_frame, text="Backup Directory:").pack(side=tk.LEFT)
-        self.backup_dir_var = tk.StringVar(value=self.backup_config.backup_dir)
         ttk.Entry(dir_frame, textvariable=self.backup_dir_var, width=50).pack(side=tk.LEFT, padx=(10, 5))
         ttk.Button(dir_frame, text="Browse", command=self.browse_backup_dir).pack(side=tk.LEFT)
         
@@ -368,15 +589,12 @@ class WarpArchiverGUI:
         options_frame = ttk.Frame(config_frame)
         options_frame.pack(fill=tk.X, padx=10, pady=5)
         
-        self.backup_compression_var = tk.BooleanVar(value=self.backup_config.enable_compression)
         ttk.Checkbutton(options_frame, text="Enable Compression", variable=self.backup_compression_var).pack(side=tk.LEFT)
         
         ttk.Label(options_frame, text="Retention Days:").pack(side=tk.LEFT, padx=(20, 5))
-        self.retention_days_var = tk.IntVar(value=self.backup_config.retention_days)
         ttk.Entry(options_frame, textvariable=self.retention_days_var, width=10).pack(side=tk.LEFT)
         
         ttk.Label(options_frame, text="Max Backups:").pack(side=tk.LEFT, padx=(20, 5))
-        self.max_backups_var = tk.IntVar(value=self.backup_config.max_backups)
         ttk.Entry(options_frame, textvariable=self.max_backups_var, width=10).pack(side=tk.LEFT)
         
         # Backup format
@@ -385,7 +603,6 @@ class WarpArchiverGUI:
         
         ttk.Label(format_frame, text="Backup Format:").pack(side=tk.LEFT)
         
-        self.backup_format_var = tk.StringVar(value=self.backup_config.backup_format)
         backup_formats = [("SQLite", "sqlite"), ("JSON", "json"), ("Both", "both")]
         
         for text, value in backup_formats:
@@ -433,10 +650,8 @@ class WarpArchiverGUI:
         # Load backup history
         self.refresh_backup_history()
     
-    def create_settings_tab(self):
+    def create_settings_tab(self, frame: ttk.Frame):
         """Create the settings tab"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Settings")
         
         # Database settings
         db_frame = ttk.LabelFrame(frame, text="Database Settings")
@@ -447,7 +662,6 @@ class WarpArchiverGUI:
         db_path_frame.pack(fill=tk.X, padx=10, pady=10)
         
         ttk.Label(db_path_frame, text="Warp Database Path:").pack(side=tk.LEFT)
-        self.db_path_var = tk.StringVar(value=str(self.db_manager.db_path))
         ttk.Entry(db_path_frame, textvariable=self.db_path_var, width=60, state=tk.DISABLED).pack(side=tk.LEFT, padx=(10, 5))
         ttk.Button(db_path_frame, text="Test Connection", command=self.test_database_connection).pack(side=tk.LEFT)
         
@@ -460,7 +674,6 @@ class WarpArchiverGUI:
         
         ttk.Label(log_level_frame, text="Log Level:").pack(side=tk.LEFT)
         
-        self.log_level_var = tk.StringVar(value="INFO")
         log_levels = ["DEBUG", "INFO", "WARNING", "ERROR"]
         
         ttk.Combobox(log_level_frame, textvariable=self.log_level_var, values=log_levels, state="readonly", width=10).pack(side=tk.LEFT, padx=(10, 0))
@@ -472,11 +685,9 @@ class WarpArchiverGUI:
         perf_options_frame = ttk.Frame(perf_frame)
         perf_options_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        self.auto_refresh_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(perf_options_frame, text="Auto-refresh conversations", variable=self.auto_refresh_var).pack(side=tk.LEFT)
         
         ttk.Label(perf_options_frame, text="Refresh Interval (seconds):").pack(side=tk.LEFT, padx=(20, 5))
-        self.refresh_interval_var = tk.IntVar(value=30)
         ttk.Entry(perf_options_frame, textvariable=self.refresh_interval_var, width=10).pack(side=tk.LEFT)
         
         # Configuration management
@@ -517,72 +728,52 @@ For support and updates, visit the project repository.
         info_text.insert(tk.END, info_content)
         info_text.config(state=tk.DISABLED)
     
-    def create_statistics_tab(self):
+    def create_statistics_tab(self, frame: ttk.Frame):
         """Create the statistics tab"""
-        frame = ttk.Frame(self.notebook)
-        self.notebook.add(frame, text="Statistics")
         
         # Database statistics
         db_stats_frame = ttk.LabelFrame(frame, text="Database Statistics")
         db_stats_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        # Get database stats
-        stats = self.db_manager.get_database_stats()
-        
         stats_grid_frame = ttk.Frame(db_stats_frame)
         stats_grid_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        # Create statistics display
-        stats_info = [
-            ("Total Conversations:", str(stats.get('total_conversations', 0))),
-            ("Database Size:", f"{stats.get('database_size', 0) / (1024*1024):.1f} MB"),
-            ("Total Data Size:", f"{stats.get('total_data_size', 0) / (1024*1024):.1f} MB"),
-            ("Oldest Conversation:", str(stats.get('oldest_conversation', 'N/A'))),
-            ("Newest Conversation:", str(stats.get('newest_conversation', 'N/A')))
-        ]
+        # Create statistics display; values are filled in once computed
+        db_labels = ["Total Conversations:", "Database Size:", "Total Data Size:",
+                     "Oldest Conversation:", "Newest Conversation:"]
+        self.db_stats_values = []
         
-        for i, (label, value) in enumerate(stats_info):
+        for i, label in enumerate(db_labels):
             ttk.Label(stats_grid_frame, text=label, font=("TkDefaultFont", 10, "bold")).grid(row=i, column=0, sticky=tk.W, padx=5, pady=2)
-            ttk.Label(stats_grid_frame, text=value).grid(row=i, column=1, sticky=tk.W, padx=20, pady=2)
+            value_label = ttk.Label(stats_grid_frame, text="...")
+            value_label.grid(row=i, column=1, sticky=tk.W, padx=20, pady=2)
+            self.db_stats_values.append(value_label)
         
         # Backup statistics
         backup_stats_frame = ttk.LabelFrame(frame, text="Backup Statistics")
         backup_stats_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        backup_stats = self.backup_manager.get_backup_stats()
-        
         backup_grid_frame = ttk.Frame(backup_stats_frame)
         backup_grid_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        backup_info = [
-            ("Total Backups:", str(backup_stats.get('total_backups', 0))),
-            ("Total Backup Size:", f"{backup_stats.get('total_size', 0) / (1024*1024):.1f} MB"),
-            ("Oldest Backup:", str(backup_stats.get('oldest_backup', 'N/A'))),
-            ("Newest Backup:", str(backup_stats.get('newest_backup', 'N/A')))
-        ]
+        backup_labels = ["Total Backups:", "Total Backup Size:", "Oldest Backup:", "Newest Backup:"]
+        self.backup_stats_values = []
         
-        for i, (label, value) in enumerate(backup_info):
+        for i, label in enumerate(backup_labels):
             ttk.Label(backup_grid_frame, text=label, font=("TkDefaultFont", 10, "bold")).grid(row=i, column=0, sticky=tk.W, padx=5, pady=2)
-            ttk.Label(backup_grid_frame, text=value).grid(row=i, column=1, sticky=tk.W, padx=20, pady=2)
+            value_label = ttk.Label(backup_grid_frame, text="...")
+            value_label.grid(row=i, column=1, sticky=tk.W, padx=20, pady=2)
+            self.backup_stats_values.append(value_label)
         
         # Backup types breakdown
-        if backup_stats.get('backup_types'):
-            types_frame = ttk.Frame(backup_stats_frame)
-            types_frame.pack(fill=tk.X, padx=10, pady=(10, 10))
-            
-            ttk.Label(types_frame, text="Backup Types:", font=("TkDefaultFont", 10, "bold")).pack(anchor=tk.W)
-            
-            for backup_type, count in backup_stats['backup_types'].items():
-                ttk.Label(types_frame, text=f"  {backup_type.title()}: {count}").pack(anchor=tk.W, padx=20)
+        self.backup_types_frame = ttk.Frame(backup_stats_frame)
+        self.backup_types_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
         
         # Activity statistics (placeholder for future implementation)
         activity_frame = ttk.LabelFrame(frame, text="Activity Statistics")
         activity_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        activity_text = scrolledtext.ScrolledText(activity_frame, height=10, state=tk.DISABLED)
-        activity_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
-        # Add activity info (placeholder)
+        # Add activity info (placeholder); static text needs no Text widget
         activity_content = """Activity Statistics:
 
 This section will show:
@@ -595,127 +786,496 @@ This section will show:
 (Feature coming in future updates)
 """
         
-        activity_text.config(state=tk.NORMAL)
-        activity_text.insert(tk.END, activity_content)
-        activity_text.config(state=tk.DISABLED)
+        ttk.Label(activity_frame, text=activity_content, justify=tk.LEFT, anchor=tk.NW).pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
         # Refresh button
         refresh_frame = ttk.Frame(frame)
         refresh_frame.pack(fill=tk.X, padx=10, pady=10)
         
         ttk.Button(refresh_frame, text="Refresh Statistics", command=self.refresh_statistics).pack(side=tk.RIGHT)
+        
+        # Compute the statistics in the background worker
+        self._run_in_worker(self._compute_statistics, done_cb=self._show_statistics)
+    
+    def _stats_cache_key(self, path: Path) -> Optional[int]:
+        """Modification stamp used to tell whether cached statistics are stale"""
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+    
+    def _compute_statistics(self) -> tuple:
+        """Compute database and backup statistics, reusing unchanged results"""
+        # SQLite in WAL mode writes to the -wal file first
+        db_path = Path(self.db_manager.db_path)
+        db_key = (self._stats_cache_key(db_path),
+                  self._stats_cache_key(db_path.with_name(db_path.name + "-wal")))
+        cached = self._stats_cache.get('db')
+        if cached and cached[0] == db_key:
+            stats = cached[1]
+        else:
+            stats = self.db_manager.get_database_stats()
+            self._stats_cache['db'] = (db_key, stats)
+        
+        backup_key = self._stats_cache_key(self._backup_dir_path)
+        cached = self._stats_cache.get('backup')
+        if cached and cached[0] == backup_key:
+            backup_stats = cached[1]
+        else:
+            backup_stats = self.backup_manager.get_backup_stats()
+            self._stats_cache['backup'] = (backup_key, backup_stats)
+        
+        return stats, backup_stats
+    
+    def _show_statistics(self, result: tuple):
+        """Fill the statistics tab with computed values"""
+        stats, backup_stats = result
+        
+        stats_info = [
+            str(stats.get('total_conversations', 0)),
+            f"{stats.get('database_size', 0) / MiB:.1f} MB",
+            f"{stats.get('total_data_size', 0) / MiB:.1f} MB",
+            str(stats.get('oldest_conversation', 'N/A')),
+            str(stats.get('newest_conversation', 'N/A'))
+        ]
+        for value_label, value in zip(self.db_stats_values, stats_info):
+            value_label.config(text=value)
+        
+        backup_info = [
+            str(backup_stats.get('total_backups', 0)),
+            f"{backup_stats.get('total_size', 0) / MiB:.1f} MB",
+            str(backup_stats.get('oldest_backup', 'N/A')),
+            str(backup_stats.get('newest_backup', 'N/A'))
+        ]
+        for value_label, value in zip(self.backup_stats_values, backup_info):
+            value_label.config(text=value)
+        
+        for child in self.backup_types_frame.winfo_children():
+            child.destroy()
+        
+        if backup_stats.get('backup_types'):
+            ttk.Label(self.backup_types_frame, text="Backup Types:", font=("TkDefaultFont", 10, "bold")).pack(anchor=tk.W)
+            
+            for backup_type, count in backup_stats['backup_types'].items():
+                ttk.Label(self.backup_types_frame, text=f"  {backup_type.title()}: {count}").pack(anchor=tk.W, padx=20)
+    
+    def _worker_loop(self):
+        """Run queued tasks, handing each result to its callback on the Tk thread"""
+        while True:
+            fn, args, done_cb = self._work_q.get()
+            try:
+                result = fn(*args)
+            except Exception as e:
+                self.logger.error(f"Background task failed: {e}")
+                continue
+            
+            if done_cb is not None:
+                self._post_ui(done_cb, result)
+    
+    def _post_ui(self, fn, *args):
+        """Queue fn(*args) to run on the Tk thread; safe from any thread"""
+        self._ui_q.put((fn, args))
+    
+    def _poll_ui(self):
+        """Run callbacks posted by worker threads, then poll again shortly"""
+        try:
+            while True:
+                try:
+                    fn, args = self._ui_q.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    fn(*args)
+                except Exception as e:
+                    self.logger.error(f"UI callback failed: {e}")
+        finally:
+            self.root.after(UI_POLL_INTERVAL_MS, self._poll_ui)
     
-    def load_conversations(self):
+    def _run_in_worker(self, fn, *args, done_cb=None):
+        """Queue fn(*args) for the background worker"""
+        self._work_q.put((fn, args, done_cb))
+    
+    def load_conversations(self, page_size: int = 500):
         """Load conversations from database"""
+        # A load that has not started yet will already pick up fresh data
+        if self._load_queued:
+            return
+        
+        self._load_generation += 1
+        generation = self._load_generation
+        self._load_queued = True
+        
+        progress = self.start_progress()
+        
         def load_task():
-            self.progress_bar.start()
-            self.update_status("Loading conversations...")
+            self._load_queued = False
+            self._post_ui(self.update_status, "Loading conversations...")
             
             try:
-                conversations = self.db_manager.get_all_conversations()
-                
-                # Update UI in main thread
-                self.root.after(0, lambda: self.update_conversations_list(conversations))
+                # Stream pages so the first screen shows after one query
+                offset = 0
+                while generation == self._load_generation:
+                    page = self.db_manager.get_conversations_paged(page_size, offset)
+                    
+                    # Update UI in main thread
+                    if offset == 0:
+                        self._post_ui(lambda page=page: self._load_first_page(generation, page))
+                    elif page:
+                        self._post_ui(lambda page=page: self._append_page(generation, page))
+                    
+                    if len(page) < page_size:
+                        break
+                    offset += page_size
                 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to load conversations: {e}"))
+                self._post_ui(messagebox.showerror, "Error", f"Failed to load conversations: {e}")
             finally:
-                self.root.after(0, lambda: [self.progress_bar.stop(), self.update_status("Ready")])
+                self._post_ui(lambda: [self.stop_progress(progress), self.update_status("Ready")])
+        
+        self._run_in_worker(load_task)
+    
+    def _load_first_page(self, generation: int, page: List[ChatConversation]):
+        """Replace the conversations list with the first page of a load, or a date filter result"""
+        if generation == self._load_generation:
+            self.update_conversations_list(page)
+    
+    def _append_page(self, generation: int, page: List[ChatConversation]):
+        """Add a further page of loaded conversations to the list"""
+        if generation != self._load_generation:
+            return
+        
+        views = [self._build_view(conv) for conv in page]
+        self.conversations.extend(page)
+        self._by_id.update((conv.conversation_id, conv) for conv in page)
+        self._views.extend(views)
         
-        # Run in background thread
-        threading.Thread(target=load_task, daemon=True).start()
+        # Only rows matching the active search join the filtered list
+        search_term = self.search_var.get().casefold()
+        matches = [i for i, view in enumerate(views) if search_term in view.haystack]
+        if not matches:
+            return
+        
+        self._last_filter_was_empty = False
+        self.filtered_conversations.extend([page[i] for i in matches])
+        self._filtered_views.extend([views[i] for i in matches])
+        
+        self._render_conversations()
+        self.update_selection_info()
     
     def update_conversations_list(self, conversations: List[ChatConversation]):
         """Update the conversations treeview"""
         self.conversations = conversations
-        self.filtered_conversations = conversations.copy()
+        self._by_id = {conv.conversation_id: conv for conv in conversations}
         
-        # Clear existing items
-        for item in self.conversations_tree.get_children():
-            self.conversations_tree.delete(item)
+        # Views of the previous load are reused for unchanged conversations
+        self._stale_views, self._view_cache = self._view_cache, {}
+        self._views = [self._build_view(conv) for conv in conversations]
         
-        # Add conversations
-        for conv in conversations:
-            date_str = conv.last_modified_at.split('T')[0] if 'T' in conv.last_modified_at else conv.last_modified_at.split()[0]
+        # Keep any active search applied, as later pages are filtered too
+        self._do_search()
+    
+    def _build_view(self, conv: ChatConversation) -> _ConvView:
+        """Format the treeview values and search text of a conversation"""
+        key = (conv.conversation_id, conv.last_modified_at)
+        view = self._stale_views.pop(key, None)
+        if view is None:
+            summary = conv.get_summary()
             
-            self.conversations_tree.insert("", tk.END, values=(
-                date_str,
-                conv.conversation_id[:40] + "..." if len(conv.conversation_id) > 40 else conv.conversation_id,
-                conv.get_summary()[:50] + "..." if len(conv.get_summary()) > 50 else conv.get_summary(),
-                str(conv.message_count)
-            ), tags=(conv.conversation_id,))
+            # The unit separator keeps matches from spanning two fields
+            parts = [conv.conversation_id, summary]
+            if conv.parsed_data:
+                parts.append(str(conv.parsed_data))
+            
+            view = _ConvView(
+                # ISO timestamps use either 'T' or a space before the time
+                date=conv.last_modified_at.partition('T')[0].partition(' ')[0],
+                cid=conv.conversation_id[:40] + "..." if len(conv.conversation_id) > 40 else conv.conversation_id,
+                summary=summary[:50] + "..." if len(summary) > 50 else summary,
+                messages=str(conv.message_count),
+                haystack="\x1f".join(parts).casefold()
+            )
         
-        self.update_selection_info()
+        self._view_cache[key] = view
+        return view
     
     def on_search_changed(self, *args):
         """Handle search text changes"""
-        search_term = self.search_var.get().lower()
+        # Only filter once typing pauses, not on every keystroke
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(150, self._do_search)
+    
+    def _do_search(self):
+        """Filter conversations by the current search text"""
+        self._search_after_id = None
+        search_term = self.search_var.get().casefold()
+        
+        self._search_token += 1
         
         if not search_term:
             self.filtered_conversations = self.conversations.copy()
-        else:
-            self.filtered_conversations = [
-                conv for conv in self.conversations
-                if (search_term in conv.conversation_id.lower() or
-                    search_term in conv.get_summary().lower() or
-                    (conv.parsed_data and search_term in str(conv.parsed_data).lower()))
-            ]
+            self._filtered_views = self._views.copy()
+            self.update_filtered_list()
+            return
+        
+        # Scan in the search thread; results of outdated searches are dropped
+        views = self._views
+        self._search_executor.submit(self._search_task, self._search_token, views, len(views), search_term)
+    
+    def _search_task(self, token: int, views: List[_ConvView], count: int, search_term: str):
+        """Find the first count views matching search_term, off the Tk thread"""
+        try:
+            matches = [i for i in range(count) if search_term in views[i].haystack]
+        except Exception as e:
+            self.logger.error(f"Search failed: {e}")
+            return
         
+        self._post_ui(self._apply_search, token, views, count, search_term, matches)
+    
+    def _apply_search(self, token: int, views: List[_ConvView], count: int,
+                      search_term: str, matches: List[int]):
+        """Show the result of a finished search if it is still current"""
+        if token != self._search_token or views is not self._views:
+            return
+        
+        # Include pages that were loaded while the search ran
+        matches.extend(i for i in range(count, len(views)) if search_term in views[i].haystack)
+        
+        self.filtered_conversations = [self.conversations[i] for i in matches]
+        self._filtered_views = [views[i] for i in matches]
         self.update_filtered_list()
     
     def update_filtered_list(self):
         """Update treeview with filtered results"""
-        # Clear existing items
-        for item in self.conversations_tree.get_children():
-            self.conversations_tree.delete(item)
+        # Typing on past a search with no matches leaves the empty view as is
+        if not self.filtered_conversations:
+            if self._last_filter_was_empty:
+                return
+            self._last_filter_was_empty = True
+        else:
+            self._last_filter_was_empty = False
         
-        # Add filtered conversations
-        for conv in self.filtered_conversations:
-            date_str = conv.last_modified_at.split('T')[0] if 'T' in conv.last_modified_at else conv.last_modified_at.split()[0]
-            
-            self.conversations_tree.insert("", tk.END, values=(
-                date_str,
-                conv.conversation_id[:40] + "..." if len(conv.conversation_id) > 40 else conv.conversation_id,
-                conv.get_summary()[:50] + "..." if len(conv.get_summary()) > 50 else conv.get_summary(),
-                str(conv.message_count)
-            ), tags=(conv.conversation_id,))
+        self._view_offset = 0
+        
+        # Indices now refer to different conversations; recycle every item
+        self._rendered_rows = {}
+        
+        # Drop selections that are no longer visible in the filtered list
+        filtered_ids = {conv.conversation_id for conv in self.filtered_conversations}
+        self._selected_ids &= filtered_ids
+        self.selected_conversations = [conv for conv in self.filtered_conversations
+                                       if conv.conversation_id in self._selected_ids]
         
+        self._render_conversations()
+        self.update_selection_info()
+    
+    def _render_conversations(self):
+        """Show the rows of the filtered list that fall inside the viewport"""
+        tree = self.conversations_tree
+        total = len(self._filtered_views)
+        count = max(0, min(self._visible_rows, total - self._view_offset))
+        
+        # Talk to Tcl directly; the ttk.Treeview wrappers re-parse their
+        # options on every call, which dominates when filling many rows
+        call = tree.tk.call
+        widget = tree._w
+        
+        # Rows still inside the window keep their item; only rows that
+        # scrolled in get values, reusing items of rows that scrolled out
+        offset = self._view_offset
+        window = range(offset, offset + count)
+        kept = {index: iid for iid, index in self._rendered_rows.items() if index in window}
+        in_use = set(kept.values())
+        free = [iid for iid in self._row_pool if iid not in in_use]
+        
+        views = self._filtered_views
+        created = []
+        updated = []
+        for index in window:
+            if index not in kept:
+                if free:
+                    iid = free.pop()
+                    updated.extend((iid, views[index].values))
+                else:
+                    # Grow the pool of reusable items on demand
+                    iid = f"row{len(self._row_pool)}"
+                    self._row_pool.append(iid)
+                    created.extend((iid, views[index].values))
+                kept[index] = iid
+        
+        # One Tcl loop per kind of change instead of one call per row
+        if created:
+            call("foreach", ("row_iid", "row_values"), created,
+                 f"{widget} insert {{}} end -id $row_iid -values $row_values")
+        if updated:
+            call("foreach", ("row_iid", "row_values"), updated,
+                 f"{widget} item $row_iid -values $row_values")
+        
+        shown = [kept[index] for index in window]
+        self._rendered_rows = {iid: index for index, iid in kept.items()}
+        
+        # Attach the used items in order and detach the rest in one swap
+        call(widget, "children", "", shown)
+        
+        # Selection lives on conversations, not on the recycled items
+        wanted = tuple(iid for iid, index in self._rendered_rows.items()
+                       if self.filtered_conversations[index].conversation_id in self._selected_ids)
+        if set(tree.selection()) != set(wanted):
+            self._selection_echo = wanted
+            tree.selection_set(wanted)
+        
+        # Scrollbar reflects the position within the whole list
+        if total:
+            self.conversations_scrollbar.set(self._view_offset / total,
+                                             (self._view_offset + count) / total)
+        else:
+            self.conversations_scrollbar.set(0.0, 1.0)
+    
+    def _scroll_conversations_to(self, offset: int):
+        """Move the viewport to start at the given row"""
+        max_offset = max(0, len(self._filtered_views) - self._visible_rows)
+        offset = max(0, min(int(offset), max_offset))
+        if offset != self._view_offset:
+            self._view_offset = offset
+            self._render_conversations()
+    
+    def _on_conversations_yview(self, *args):
+        """Scrollbar command for the virtualized list"""
+        if args[0] == tk.MOVETO:
+            self._scroll_conversations_to(round(float(args[1]) * len(self._filtered_views)))
+        elif args[0] == tk.SCROLL:
+            step = self._visible_rows if args[2] == tk.PAGES else 1
+            self._scroll_conversations_to(self._view_offset + int(args[1]) * step)
+    
+    def _on_conversations_wheel(self, event):
+        """Scroll the virtualized list with the mouse wheel"""
+        if event.num == 4 or event.delta > 0:
+            self._scroll_conversations_to(self._view_offset - 3)
+        else:
+            self._scroll_conversations_to(self._view_offset + 3)
+        return "break"
+    
+    def _on_conversations_key(self, event):
+        """Move the cursor row with the arrow and page keys, scrolling the list as needed"""
+        total = len(self._filtered_views)
+        if not total:
+            return "break"
+        
+        tree = self.conversations_tree
+        current = self._rendered_rows.get(tree.focus())
+        if current is None:
+            selected = [self._rendered_rows[iid] for iid in tree.selection() if iid in self._rendered_rows]
+            current = min(selected) if selected else None
+        
+        if current is None:
+            # Without a cursor row the first visible row becomes the cursor
+            target = min(self._view_offset, total - 1)
+        else:
+            step = {"Up": -1, "Down": 1, "Prior": -self._visible_rows, "Next": self._visible_rows}[event.keysym]
+            target = max(0, min(current + step, total - 1))
+        
+        # Keep the target row inside the viewport
+        if target < self._view_offset:
+            self._view_offset = target
+        elif target >= self._view_offset + self._visible_rows:
+            self._view_offset = target - self._visible_rows + 1
+        
+        conv = self.filtered_conversations[target]
+        if event.state & 0x0001:
+            # Shift extends the selection, as a click would
+            self._selected_ids.add(conv.conversation_id)
+            selected = [self._by_id[conv_id] for conv_id in self._selected_ids if conv_id in self._by_id]
+            selected.sort(key=lambda conv: conv.last_modified_at, reverse=True)
+            self.selected_conversations = selected
+        else:
+            self._selected_ids = {conv.conversation_id}
+            self.selected_conversations = [conv]
+        
+        self._render_conversations()
+        for iid, index in self._rendered_rows.items():
+            if index == target:
+                tree.focus(iid)
+                break
         self.update_selection_info()
+        return "break"
+    
+    def _on_conversations_configure(self, event):
+        """Recompute how many rows fit when the treeview is resized"""
+        # Row geometry is measured once, from the first row that is shown
+        if self._row_metrics is None and self._rendered_rows:
+            bbox = self.conversations_tree.bbox(next(iter(self._rendered_rows)))
+            if bbox:
+                self._row_metrics = (bbox[1], bbox[3])
+        header_height, row_height = self._row_metrics or (25, 20)
+        
+        visible = max(1, (event.height - header_height) // row_height + 1)
+        if visible != self._visible_rows:
+            self._visible_rows = visible
+            self._scroll_conversations_to(self._view_offset)
+            self._render_conversations()
+    
+    def _track_selection_modifiers(self, event):
+        """Remember whether the next selection change extends the current one"""
+        # Shift (0x0001) or Control (0x0004) held
+        self._extend_selection = bool(event.state & 0x0005)
     
     def on_conversation_select(self, event):
         """Handle conversation selection"""
         selected_items = self.conversations_tree.selection()
         
-        self.selected_conversations = []
-        for item in selected_items:
-            tags = self.conversations_tree.item(item)['tags']
-            if tags:
-                conv_id = tags[0]
-                # Find conversation by ID
-                for conv in self.filtered_conversations:
-                    if conv.conversation_id == conv_id:
-                        self.selected_conversations.append(conv)
-                        break
+        # Ignore the event raised by our own selection_set during rendering
+        if self._selection_echo is not None:
+            echo, self._selection_echo = self._selection_echo, None
+            if set(selected_items) == set(echo):
+                return
+        
+        selected_rows = sorted(self._rendered_rows[item] for item in selected_items
+                               if item in self._rendered_rows)
+        selected = [self.filtered_conversations[index] for index in selected_rows]
+        
+        if self._extend_selection:
+            # Keep selections made while other rows were scrolled into view
+            visible_ids = {self.filtered_conversations[index].conversation_id
+                           for index in self._rendered_rows.values()}
+            self._selected_ids -= visible_ids
+            self._selected_ids.update(conv.conversation_id for conv in selected)
+            
+            # Resolve ids by hash lookup, in list order (newest first)
+            selected = [self._by_id[conv_id] for conv_id in self._selected_ids if conv_id in self._by_id]
+            selected.sort(key=lambda conv: conv.last_modified_at, reverse=True)
+        else:
+            self._selected_ids = {conv.conversation_id for conv in selected}
+        
+        self.selected_conversations = selected
         
         self.update_selection_info()
     
     def update_selection_info(self):
         """Update selection information label"""
         if not self.selected_conversations:
-            self.selection_label.config(text=f"No conversations selected ({len(self.filtered_conversations)} total)")
-            self.update_content_preview(None)
+            text = f"No conversations selected ({len(self.filtered_conversations)} total)"
+            first = None
         else:
-            self.selection_label.config(text=f"{len(self.selected_conversations)} conversations selected ({len(self.filtered_conversations)} total)")
+            text = f"{len(self.selected_conversations)} conversations selected ({len(self.filtered_conversations)} total)"
             # Show preview of first selected conversation
-            if self.selected_conversations:
-                self.update_content_preview(self.selected_conversations[0])
+            first = self.selected_conversations[0]
+        
+        # Extending or scrolling a selection rarely changes either, and
+        # re-rendering the preview would also drop any loaded windows
+        if text != self._selection_text:
+            self._selection_text = text
+            self.selection_label.config(text=text)
+        if first is None or first is not self._previewed:
+            self.update_content_preview(first)
     
     def update_content_preview(self, conversation):
         """Update the content preview pane"""
+        self._previewed = conversation
         self.content_preview.config(state=tk.NORMAL)
         self.content_preview.delete(1.0, tk.END)
         
         if conversation is None:
+            self._preview_tail = ""
             self.content_preview.insert(tk.END, "Select a conversation to see its content...")
         else:
             # Show conversation info header
@@ -724,13 +1284,34 @@ This section will show:
             header += f"Summary: {conversation.get_summary()}\n"
             header += "="*60 + "\n\n"
             
-            self.content_preview.insert(tk.END, header)
-            
-            # Show readable content
+            # Show readable content, one window at a time for long chats
             content = conversation.get_readable_content()
-            self.content_preview.insert(tk.END, content)
+            self.content_preview.insert(tk.END, header + content[:PREVIEW_CHUNK_SIZE])
+            self._preview_tail = content[PREVIEW_CHUNK_SIZE:]
+            self._insert_preview_sentinel()
+        
+        self.content_preview.config(state=tk.DISABLED)
+    
+    def _insert_preview_sentinel(self):
+        """Mark a truncated preview; the text widget must be writable"""
+        if self._preview_tail:
+            self.content_preview.insert(tk.END, "\n\n— truncated, press End for more —", "preview_more")
+    
+    def load_more_preview(self, event=None):
+        """Append the next window of a truncated preview"""
+        if not self._preview_tail:
+            return None
+        
+        chunk = self._preview_tail[:PREVIEW_CHUNK_SIZE]
+        self._preview_tail = self._preview_tail[PREVIEW_CHUNK_SIZE:]
         
+        self.content_preview.config(state=tk.NORMAL)
+        self.content_preview.delete("preview_more.first", "preview_more.last")
+        self.content_preview.insert(tk.END, chunk)
+        self._insert_preview_sentinel()
         self.content_preview.config(state=tk.DISABLED)
+        self.content_preview.see(tk.END)
+        return "break"
     
     # Import functionality methods
     def browse_import_file(self):
@@ -759,43 +1340,56 @@ This section will show:
             messagebox.showwarning("Warning", "Please select a file to validate.")
             return
         
+        progress = self.start_progress()
+        
         def validate_task():
-            self.progress_bar.start()
-            self.update_status("Validating import file...")
+            self._post_ui(self.update_status, "Validating import file...")
             
             try:
-                is_valid, message, count = self.import_manager.validate_import_file(file_path)
+                # The same file validated again (even via another path) reuses the result
+                cache_key = self._import_cache_key(file_path)
+                cached = self._import_validation_cache.get(cache_key) if cache_key else None
+                if cached:
+                    is_valid, message, count = cached
+                else:
+                    is_valid, message, count = self.import_manager.validate_import_file(file_path)
+                    if cache_key:
+                        self._import_validation_cache[cache_key] = (is_valid, message, count)
                 
                 if is_valid:
-                    file_type = "Unknown"
-                    if ".json" in file_path:
-                        file_type = "JSON Export"
-                    elif ".sqlite" in file_path:
-                        file_type = "SQLite Database"
-                    elif ".csv" in file_path:
-                        file_type = "CSV Export"
+                    file_type = _detect_import_kind(file_path).value
                     
-                    self.root.after(0, lambda: [
+                    self._post_ui(lambda: [
                         self.import_type_label.config(text=f"{file_type} ({count} conversations)", foreground="green"),
                         self.log_import_action(f"✅ Validation successful: {message}"),
                         messagebox.showinfo("Validation Successful", f"{message}\n\nFile is ready for import.")
                     ])
                 else:
-                    self.root.after(0, lambda: [
+                    self._post_ui(lambda: [
                         self.import_type_label.config(text="Invalid file", foreground="red"),
                         self.log_import_action(f"❌ Validation failed: {message}"),
                         messagebox.showerror("Validation Failed", f"File validation failed:\n{message}")
                     ])
                     
             except Exception as e:
-                self.root.after(0, lambda: [
-                    messagebox.showerror("Error", f"Validation error: {e}"),
-                    self.log_import_action(f"❌ Validation error: {e}")
-                ])
+                self._post_ui(messagebox.showerror, "Error", f"Validation error: {e}")
+                self._post_ui(self.log_import_action, f"❌ Validation error: {e}")
             finally:
-                self.root.after(0, lambda: [self.progress_bar.stop(), self.update_status("Ready")])
+                self._post_ui(lambda: [self.stop_progress(progress), self.update_status("Ready")])
         
-        threading.Thread(target=validate_task, daemon=True).start()
+        self._submit(validate_task)
+    
+    def _import_cache_key(self, file_path: str) -> Optional[bytes]:
+        """Identify an import file by its size, mtime and a hash of its first MiB"""
+        try:
+            with open(file_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                digest = hashlib.blake2b(f.read(1 << 20), digest_size=16)
+        except OSError:
+            return None
+        
+        digest.update(f"{st.st_size}:{st.st_mtime_ns}".encode())
+        return digest.digest()
     
     def preview_import(self):
         """Preview what would be imported"""
@@ -804,16 +1398,20 @@ This section will show:
             messagebox.showwarning("Warning", "Please select a file to preview.")
             return
         
+        # Settings are read here, on the Tk thread
+        overwrite = self.overwrite_existing_var.get()
+        conflict_mode = self.conflict_resolution_var.get()
+        progress = self.start_progress()
+        
         def preview_task():
-            self.progress_bar.start()
-            self.update_status("Analyzing import file...")
+            self._post_ui(self.update_status, "Analyzing import file...")
             
             try:
                 # Validate first
                 is_valid, message, count = self.import_manager.validate_import_file(file_path)
                 
                 if not is_valid:
-                    self.root.after(0, lambda: messagebox.showerror("Error", f"Invalid file: {message}"))
+                    self._post_ui(messagebox.showerror, "Error", f"Invalid file: {message}")
                     return
                 
                 # Generate preview info
@@ -822,37 +1420,30 @@ This section will show:
                 preview_text += f"Type: {message}\n"
                 preview_text += f"Conversations to import: {count}\n\n"
                 
-                overwrite = self.overwrite_existing_var.get()
-                conflict_mode = self.conflict_resolution_var.get()
-                
                 preview_text += f"Import Settings:\n"
                 preview_text += f"  - Overwrite existing: {'Yes' if overwrite else 'No'}\n"
                 preview_text += f"  - Conflict resolution: {conflict_mode.title()}\n\n"
                 
                 # Check for potential conflicts
-                existing_conversations = self.db_manager.get_all_conversations()
-                existing_ids = {conv.conversation_id for conv in existing_conversations}
+                existing_ids = self._existing_ids
+                if existing_ids is None:
+                    existing_ids = self._existing_ids = self.db_manager.get_all_conversation_ids()
                 
                 conflicts = 0
-                if file_path.endswith('.json') or (file_path.endswith('.gz') and '.json' in file_path):
-                    # Quick check for JSON files
+                if _detect_import_kind(file_path) is ImportKind.JSON:
+                    # Stream the conversations so large archives never sit in memory whole
                     try:
-                        import json
-                        import gzip
-                        
-                        if file_path.endswith('.gz'):
-                            with gzip.open(file_path, 'rt') as f:
-                                data = json.load(f)
-                        else:
-                            with open(file_path, 'r') as f:
-                                data = json.load(f)
-                        
-                        for conv in data.get('conversations', []):
-                            if conv.get('conversation_id') in existing_ids:
-                                conflicts += 1
-                    except (json.JSONDecodeError, gzip.BadGzipFile, IOError) as e:
+                        opener = gzip.open if file_path.lower().endswith('.gz') else open
+                        with opener(file_path, 'rt', encoding='utf-8') as f:
+                            for conv in iter_json_conversations(f):
+                                if not isinstance(conv, dict):
+                                    continue
+                                conv_id = conv.get('conversation_id')
+                                if isinstance(conv_id, str) and conv_id in existing_ids:
+                                    conflicts += 1
+                    except (json.JSONDecodeError, gzip.BadGzipFile, OSError, UnicodeDecodeError) as e:
                         # Failed to parse JSON - not critical for preview
-                        self.logger.debug(f"Failed to parse JSON for conflict check: {e}")
+                        self.logger.warning(f"Failed to parse JSON for conflict check: {e}")
                 
                 preview_text += f"Potential Conflicts:\n"
                 preview_text += f"  - Existing conversations that would be affected: {conflicts}\n"
@@ -874,20 +1465,18 @@ This section will show:
                     preview_text += f"  - Imported: {count}\n"
                     preview_text += f"  - Updated: {conflicts}\n"
                 
-                self.root.after(0, lambda: [
+                self._post_ui(lambda: [
                     self.update_import_preview(preview_text),
                     self.log_import_action(f"📋 Preview generated: {count} conversations, {conflicts} conflicts")
                 ])
                 
             except Exception as e:
-                self.root.after(0, lambda: [
-                    messagebox.showerror("Error", f"Preview failed: {e}"),
-                    self.log_import_action(f"❌ Preview error: {e}")
-                ])
+                self._post_ui(messagebox.showerror, "Error", f"Preview failed: {e}")
+                self._post_ui(self.log_import_action, f"❌ Preview error: {e}")
             finally:
-                self.root.after(0, lambda: [self.progress_bar.stop(), self.update_status("Ready")])
+                self._post_ui(lambda: [self.stop_progress(progress), self.update_status("Ready")])
         
-        threading.Thread(target=preview_task, daemon=True).start()
+        self._submit(preview_task)
     
     def perform_import(self):
         """Perform the actual import operation"""
@@ -905,23 +1494,16 @@ This section will show:
         if not result:
             return
         
+        overwrite_existing = self.conflict_resolution_var.get() in ["update", "overwrite"]
+        progress = self.start_progress()
+        
         def import_task():
-            self.progress_bar.start()
-            self.update_status("Importing conversations...")
+            self._post_ui(self.update_status, "Importing conversations...")
             
             try:
-                overwrite_existing = self.conflict_resolution_var.get() in ["update", "overwrite"]
-                
                 # Determine import method based on file type
-                if file_path.endswith('.json') or (file_path.endswith('.gz') and '.json' in file_path):
-                    result = self.import_manager.import_from_json(file_path, overwrite_existing)
-                elif file_path.endswith('.sqlite') or (file_path.endswith('.gz') and '.sqlite' in file_path):
-                    result = self.import_manager.import_from_backup(file_path, overwrite_existing)
-                elif file_path.endswith('.csv'):
-                    result = self.import_manager.import_from_csv(file_path, overwrite_existing)
-                else:
-                    # Try auto-detection
-                    result = self.import_manager.import_from_backup(file_path, overwrite_existing)
+                handler = self._import_dispatch[_detect_import_kind(file_path)]
+                result = handler(file_path, overwrite_existing)
                 
                 # Show results
                 if result.success:
@@ -938,7 +1520,7 @@ This section will show:
                         if len(result.errors) > 5:
                             summary += f"  • ... and {len(result.errors) - 5} more errors\n"
                     
-                    self.root.after(0, lambda: [
+                    self._post_ui(lambda: [
                         messagebox.showinfo("Import Successful", summary),
                         self.log_import_action(f"✅ Import completed: {result.imported_count} imported, {result.skipped_count} skipped, {result.error_count} errors"),
                         self.update_import_preview(summary),
@@ -951,20 +1533,20 @@ This section will show:
                         for error in result.errors[:3]:
                             error_msg += f"• {error}\n"
                     
-                    self.root.after(0, lambda: [
+                    self._post_ui(lambda: [
                         messagebox.showerror("Import Failed", error_msg),
                         self.log_import_action(f"❌ Import failed: {result.errors[0] if result.errors else 'Unknown error'}")
                     ])
                     
             except Exception as e:
-                self.root.after(0, lambda: [
-                    messagebox.showerror("Error", f"Import error: {e}"),
-                    self.log_import_action(f"❌ Import error: {e}")
-                ])
+                self._post_ui(messagebox.showerror, "Error", f"Import error: {e}")
+                self._post_ui(self.log_import_action, f"❌ Import error: {e}")
             finally:
-                self.root.after(0, lambda: [self.progress_bar.stop(), self.update_status("Ready")])
+                self._existing_ids = None
+                self._date_range_cache = None
+                self._post_ui(lambda: [self.stop_progress(progress), self.update_status("Ready")])
         
-        threading.Thread(target=import_task, daemon=True).start()
+        self._submit(import_task)
     
     def merge_from_database(self):
         """Merge conversations from another Warp database"""
@@ -988,12 +1570,13 @@ This section will show:
         if not result:
             return
         
+        overwrite_existing = self.conflict_resolution_var.get() in ["update", "overwrite"]
+        progress = self.start_progress()
+        
         def merge_task():
-            self.progress_bar.start()
-            self.update_status("Merging databases...")
+            self._post_ui(self.update_status, "Merging databases...")
             
             try:
-                overwrite_existing = self.conflict_resolution_var.get() in ["update", "overwrite"]
                 result = self.import_manager.merge_databases(db_path, overwrite_existing)
                 
                 if result.success:
@@ -1003,26 +1586,26 @@ This section will show:
                     summary += f"  • Skipped: {result.skipped_count} conversations\n"
                     summary += f"  • Errors: {result.error_count} conversations\n"
                     
-                    self.root.after(0, lambda: [
+                    self._post_ui(lambda: [
                         messagebox.showinfo("Merge Successful", summary),
                         self.log_import_action(f"🔄 Database merge: {result.imported_count} merged from {Path(db_path).name}"),
                         self.refresh_conversations()
                     ])
                 else:
-                    self.root.after(0, lambda: [
+                    self._post_ui(lambda: [
                         messagebox.showerror("Merge Failed", f"Database merge failed:\n{result.errors[0] if result.errors else 'Unknown error'}"),
                         self.log_import_action(f"❌ Database merge failed: {result.errors[0] if result.errors else 'Unknown error'}")
                     ])
                     
             except Exception as e:
-                self.root.after(0, lambda: [
-                    messagebox.showerror("Error", f"Merge error: {e}"),
-                    self.log_import_action(f"❌ Merge error: {e}")
-                ])
+                self._post_ui(messagebox.showerror, "Error", f"Merge error: {e}")
+                self._post_ui(self.log_import_action, f"❌ Merge error: {e}")
             finally:
-                self.root.after(0, lambda: [self.progress_bar.stop(), self.update_status("Ready")])
+                self._existing_ids = None
+                self._date_range_cache = None
+                self._post_ui(lambda: [self.stop_progress(progress), self.update_status("Ready")])
         
-        threading.Thread(target=merge_task, daemon=True).start()
+        self._submit(merge_task)
     
     def import_from_backup(self):
         """Import conversations from backup file"""
@@ -1066,9 +1649,11 @@ This section will show:
         if not result:
             return
         
+        overwrite_existing = self.conflict_resolution_var.get() in ["update", "overwrite"]
+        progress = self.start_progress()
+        
         def batch_task():
-            self.progress_bar.start()
-            self.update_status(f"Batch importing {len(files)} files...")
+            self._post_ui(self.update_status, f"Batch importing {len(files)} files...")
             
             total_imported = 0
             total_skipped = 0
@@ -1076,32 +1661,53 @@ This section will show:
             failed_files = []
             
             try:
-                overwrite_existing = self.conflict_resolution_var.get() in ["update", "overwrite"]
+                def read_one(file_path):
+                    reader = self._read_dispatch[_detect_import_kind(file_path)]
+                    return reader(file_path)
                 
-                for i, file_path in enumerate(files, 1):
-                    self.root.after(0, lambda i=i: self.update_status(f"Processing file {i}/{len(files)}: {Path(file_path).name}"))
-                    
-                    try:
-                        # Determine import method
-                        if file_path.endswith('.json') or (file_path.endswith('.gz') and '.json' in file_path):
-                            result = self.import_manager.import_from_json(file_path, overwrite_existing)
-                        elif file_path.endswith('.sqlite') or (file_path.endswith('.gz') and '.sqlite' in file_path):
-                            result = self.import_manager.import_from_backup(file_path, overwrite_existing)
-                        elif file_path.endswith('.csv'):
-                            result = self.import_manager.import_from_csv(file_path, overwrite_existing)
-                        else:
-                            result = self.import_manager.import_from_backup(file_path, overwrite_existing)
+                # Files are read and parsed concurrently, a few ahead of the
+                # writes, which happen here one file at a time in the order
+                # chosen so the last file wins when updating
+                workers = min(BATCH_IMPORT_WORKERS, len(files))
+                with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                    remaining = iter(files)
+                    reads = deque((executor.submit(read_one, file_path), Path(file_path).name)
+                                  for file_path in itertools.islice(remaining, workers))
+                    last_status = 0.0
+                    i = 0
+                    while reads:
+                        # Closing the window lets running reads finish but writes nothing more
+                        if self._closing.is_set():
+                            for pending, _ in reads:
+                                pending.cancel()
+                            break
+                        
+                        future, name = reads.popleft()
+                        for file_path in itertools.islice(remaining, 1):
+                            reads.append((executor.submit(read_one, file_path), Path(file_path).name))
+                        i += 1
                         
-                        if result.success:
-                            total_imported += result.imported_count
-                            total_skipped += result.skipped_count
-                            total_errors += result.error_count
-                        else:
-                            failed_files.append(Path(file_path).name)
+                        # Status text is replaced within milliseconds; cap it at 10 Hz
+                        now = time.monotonic()
+                        if now - last_status >= STATUS_UPDATE_INTERVAL:
+                            last_status = now
+                            self._post_ui(self.update_status, f"Processed file {i}/{len(files)}: {name}")
+                        
+                        try:
+                            result, conversations = future.result()
+                            result = self.import_manager.store_conversations(
+                                result, conversations, overwrite_existing)
                             
-                    except Exception as e:
-                        failed_files.append(f"{Path(file_path).name}: {e}")
-                        total_errors += 1
+                            if result.success:
+                                total_imported += result.imported_count
+                                total_skipped += result.skipped_count
+                                total_errors += result.error_count
+                            else:
+                                failed_files.append(name)
+                                
+                        except Exception as e:
+                            failed_files.append(f"{name}: {e}")
+                            total_errors += 1
                 
                 # Show batch results
                 summary = f"Batch import completed!\n\n"
@@ -1118,7 +1724,7 @@ This section will show:
                     if len(failed_files) > 5:
                         summary += f"  • ... and {len(failed_files) - 5} more\n"
                 
-                self.root.after(0, lambda: [
+                self._post_ui(lambda: [
                     messagebox.showinfo("Batch Import Complete", summary),
                     self.log_import_action(f"📦 Batch import: {total_imported} imported from {len(files)} files"),
                     self.update_import_preview(summary),
@@ -1126,17 +1732,20 @@ This section will show:
                 ])
                 
             except Exception as e:
-                self.root.after(0, lambda: [
-                    messagebox.showerror("Error", f"Batch import error: {e}"),
-                    self.log_import_action(f"❌ Batch import error: {e}")
-                ])
+                self._post_ui(messagebox.showerror, "Error", f"Batch import error: {e}")
+                self._post_ui(self.log_import_action, f"❌ Batch import error: {e}")
             finally:
-                self.root.after(0, lambda: [self.progress_bar.stop(), self.update_status("Ready")])
+                self._existing_ids = None
+                self._date_range_cache = None
+                self._post_ui(lambda: [self.stop_progress(progress), self.update_status("Ready")])
         
-        threading.Thread(target=batch_task, daemon=True).start()
+        self._submit(batch_task)
     
     def update_import_preview(self, text: str):
         """Update the import preview text area"""
+        # Pending log lines would have been replaced along with the old text
+        self._log_buffers.pop(self.import_preview, None)
+        
         self.import_preview.config(state=tk.NORMAL)
         self.import_preview.delete(1.0, tk.END)
         self.import_preview.insert(tk.END, text)
@@ -1147,10 +1756,7 @@ This section will show:
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] {message}\n"
         
-        self.import_preview.config(state=tk.NORMAL)
-        self.import_preview.insert(tk.END, log_entry)
-        self.import_preview.see(tk.END)
-        self.import_preview.config(state=tk.DISABLED)
+        self._enqueue_log(self.import_preview, log_entry)
     
     def clear_search(self):
         """Clear search field"""
@@ -1158,6 +1764,11 @@ This section will show:
     
     def refresh_conversations(self):
         """Refresh conversations list"""
+        # Imports can rewrite a conversation without changing its timestamp,
+        # so an explicit refresh rebuilds every search haystack
+        self._view_cache = {}
+        self._existing_ids = None
+        self._date_range_cache = None
         self.load_conversations()
     
     def apply_date_filter(self):
@@ -1168,35 +1779,53 @@ This section will show:
             
             self.update_status(f"Filtering by date range: {start_date} to {end_date}")
             
+            # The filtered list replaces any load in progress, whose later
+            # pages would otherwise be appended without the date check
+            self._load_generation += 1
+            generation = self._load_generation
+            
             def filter_task():
                 try:
-                    filtered = self.db_manager.get_conversations_by_date_range(start_date, end_date)
-                    self.root.after(0, lambda: self.update_conversations_list(filtered))
+                    filtered = self._conversations_in_range(start_date, end_date)
+                    self._post_ui(self._load_first_page, generation, filtered)
                 except Exception as e:
-                    self.root.after(0, lambda: messagebox.showerror("Error", f"Failed to filter by date: {e}"))
+                    self._post_ui(messagebox.showerror, "Error", f"Failed to filter by date: {e}")
                 finally:
-                    self.root.after(0, lambda: self.update_status("Ready"))
+                    self._post_ui(lambda: self.update_status("Ready"))
             
-            threading.Thread(target=filter_task, daemon=True).start()
+            self._submit(filter_task)
             
         except Exception as e:
             messagebox.showerror("Error", f"Invalid date range: {e}")
     
+    def _conversations_in_range(self, start_date: str, end_date: str) -> List[ChatConversation]:
+        """Query a date range, reusing the previous result for the same range"""
+        cached = self._date_range_cache
+        if cached is not None and cached[0] == (start_date, end_date):
+            conversations = cached[1]
+        else:
+            conversations = self.db_manager.get_conversations_by_date_range(start_date, end_date)
+            self._date_range_cache = ((start_date, end_date), conversations)
+        
+        # Callers keep and extend the list they get, so hand out a copy
+        return list(conversations)
+    
     def show_all_conversations(self):
         """Show all conversations"""
         self.load_conversations()
     
     def select_all_conversations(self):
         """Select all visible conversations"""
-        for item in self.conversations_tree.get_children():
-            self.conversations_tree.selection_add(item)
-        
-        self.on_conversation_select(None)
+        self._selected_ids = {conv.conversation_id for conv in self.filtered_conversations}
+        self.selected_conversations = list(self.filtered_conversations)
+        self._render_conversations()
+        self.update_selection_info()
     
     def clear_selection(self):
         """Clear conversation selection"""
-        self.conversations_tree.selection_remove(self.conversations_tree.selection())
+        self._selected_ids = set()
         self.selected_conversations = []
+        self._render_conversations()
         self.update_selection_info()
     
     def view_conversation_details(self, event=None):
@@ -1258,8 +1887,10 @@ Raw Data:
             data_text = scrolledtext.ScrolledText(data_frame, height=20)
             data_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
             
-            data_text.insert(tk.END, json.dumps(conv.parsed_data, indent=2, ensure_ascii=False))
+            # Pretty-printed JSON can run to megabytes; stream it in
             data_text.config(state=tk.DISABLED)
+            encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+            self._stream_to_text(data_text, encoder.iterencode(conv.parsed_data))
         
         # Actions frame
         actions_frame = ttk.Frame(details_window)
@@ -1269,6 +1900,27 @@ Raw Data:
                   command=lambda: self.export_single_conversation(conv)).pack(side=tk.LEFT)
         ttk.Button(actions_frame, text="Close", command=details_window.destroy).pack(side=tk.RIGHT)
     
+    def _stream_to_text(self, widget: scrolledtext.ScrolledText, chunks):
+        """Append text chunks to a read-only widget, about one preview window per idle pass"""
+        pending = []
+        size = 0
+        for chunk in chunks:
+            pending.append(chunk)
+            size += len(chunk)
+            if size >= PREVIEW_CHUNK_SIZE:
+                break
+        if not pending:
+            return
+        
+        try:
+            widget.config(state=tk.NORMAL)
+            widget.insert(tk.END, "".join(pending))
+            widget.config(state=tk.DISABLED)
+        except tk.TclError:
+            # The window was closed; drop the rest
+            return
+        self.root.after_idle(self._stream_to_text, widget, chunks)
+    
     def export_single_conversation(self, conv: ChatConversation):
         """Export a single conversation"""
         file_path = filedialog.asksaveasfilename(
@@ -1285,35 +1937,29 @@ Raw Data:
         if not file_path:
             return
         
+        progress = self.start_progress()
+        
         def export_task():
-            self.progress_bar.start()
-            self.update_status("Exporting conversation...")
+            self._post_ui(self.update_status, "Exporting conversation...")
             
             try:
                 # Determine format from extension
                 ext = Path(file_path).suffix.lower()
                 
-                success = False
-                if ext == ".json":
-                    success = self.export_manager.export_to_json([conv], file_path)
-                elif ext == ".md":
-                    success = self.export_manager.export_to_markdown([conv], file_path)
-                elif ext == ".html":
-                    success = self.export_manager.export_to_html([conv], file_path)
-                elif ext == ".csv":
-                    success = self.export_manager.export_to_csv([conv], file_path)
+                exporter = self._single_exporters.get(ext.lstrip("."))
+                success = bool(exporter and exporter([conv], file_path))
                 
                 if success:
-                    self.root.after(0, lambda: messagebox.showinfo("Success", f"Conversation exported to:\n{file_path}"))
+                    self._post_ui(messagebox.showinfo, "Success", f"Conversation exported to:\n{file_path}")
                 else:
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Failed to export conversation"))
+                    self._post_ui(messagebox.showerror, "Error", "Failed to export conversation")
                     
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Export failed: {e}"))
+                self._post_ui(messagebox.showerror, "Error", f"Export failed: {e}")
             finally:
-                self.root.after(0, lambda: [self.progress_bar.stop(), self.update_status("Ready")])
+                self._post_ui(lambda: [self.stop_progress(progress), self.update_status("Ready")])
         
-        threading.Thread(target=export_task, daemon=True).start()
+        self._submit(export_task)
     
     def quick_export_selected(self):
         """Quick export selected conversations to JSON"""
@@ -1330,24 +1976,25 @@ Raw Data:
         if not file_path:
             return
         
+        progress = self.start_progress()
+        
         def export_task():
-            self.progress_bar.start()
-            self.update_status(f"Exporting {len(self.selected_conversations)} conversations...")
+            self._post_ui(self.update_status, f"Exporting {len(self.selected_conversations)} conversations...")
             
             try:
                 success = self.export_manager.export_to_json(self.selected_conversations, file_path)
                 
                 if success:
-                    self.root.after(0, lambda: messagebox.showinfo("Success", f"Exported {len(self.selected_conversations)} conversations to:\n{file_path}"))
+                    self._post_ui(messagebox.showinfo, "Success", f"Exported {len(self.selected_conversations)} conversations to:\n{file_path}")
                 else:
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Failed to export conversations"))
+                    self._post_ui(messagebox.showerror, "Error", "Failed to export conversations")
                     
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Export failed: {e}"))
+                self._post_ui(messagebox.showerror, "Error", f"Export failed: {e}")
             finally:
-                self.root.after(0, lambda: [self.progress_bar.stop(), self.update_status("Ready")])
+                self._post_ui(lambda: [self.stop_progress(progress), self.update_status("Ready")])
         
-        threading.Thread(target=export_task, daemon=True).start()
+        self._submit(export_task)
     
     def toggle_export_date_range(self):
         """Toggle export date range controls"""
@@ -1401,7 +2048,7 @@ Raw Data:
             try:
                 start_date = self.export_start_date_var.get()
                 end_date = self.export_end_date_var.get()
-                conversations = self.db_manager.get_conversations_by_date_range(start_date, end_date)
+                conversations = self._conversations_in_range(start_date, end_date)
             except Exception as e:
                 messagebox.showerror("Error", f"Invalid date range: {e}")
                 return
@@ -1422,23 +2069,18 @@ Raw Data:
         export_format = self.export_format_var.get()
         export_mode = self.export_mode_var.get()
         
+        progress = self.start_progress()
+        
         def export_task():
-            self.progress_bar.start()
-            self.update_status(f"Exporting {len(conversations)} conversations...")
+            self._post_ui(self.update_status, f"Exporting {len(conversations)} conversations...")
             
             try:
                 success = False
                 
                 if export_mode == "single":
                     # Single file export
-                    if export_format == "json":
-                        success = self.export_manager.export_to_json(conversations, output_path)
-                    elif export_format == "md":
-                        success = self.export_manager.export_to_markdown(conversations, output_path)
-                    elif export_format == "html":
-                        success = self.export_manager.export_to_html(conversations, output_path)
-                    elif export_format == "csv":
-                        success = self.export_manager.export_to_csv(conversations, output_path)
+                    exporter = self._single_exporters.get(export_format)
+                    success = bool(exporter and exporter(conversations, output_path))
                 else:
                     # Individual files export
                     success = self.export_manager.export_individual_conversations(
@@ -1446,29 +2088,42 @@ Raw Data:
                     )
                 
                 if success:
-                    self.root.after(0, lambda: [
-                        messagebox.showinfo("Success", f"Export completed successfully!\n\nExported {len(conversations)} conversations to:\n{output_path}"),
-                        self.log_export_action(f"Exported {len(conversations)} conversations to {output_path}")
-                    ])
+                    self._post_ui(messagebox.showinfo, "Success", f"Export completed successfully!\n\nExported {len(conversations)} conversations to:\n{output_path}")
+                    self._post_ui(self.log_export_action, f"Exported {len(conversations)} conversations to {output_path}")
                 else:
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Export operation failed"))
+                    self._post_ui(messagebox.showerror, "Error", "Export operation failed")
                     
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Export failed: {e}"))
+                self._post_ui(messagebox.showerror, "Error", f"Export failed: {e}")
             finally:
-                self.root.after(0, lambda: [self.progress_bar.stop(), self.update_status("Ready")])
+                self._post_ui(lambda: [self.stop_progress(progress), self.update_status("Ready")])
         
-        threading.Thread(target=export_task, daemon=True).start()
+        self._submit(export_task)
     
     def log_export_action(self, message: str):
         """Log export action to the export log"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] {message}\n"
         
-        self.export_log.config(state=tk.NORMAL)
-        self.export_log.insert(tk.END, log_entry)
-        self.export_log.see(tk.END)
-        self.export_log.config(state=tk.DISABLED)
+        self._enqueue_log(self.export_log, log_entry)
+    
+    def _enqueue_log(self, widget: scrolledtext.ScrolledText, log_entry: str):
+        """Queue a log line for a text widget, flushing at most every 50 ms"""
+        buffer = self._log_buffers.setdefault(widget, [])
+        if not buffer:
+            self.root.after(50, self._flush_log, widget)
+        buffer.append(log_entry)
+    
+    def _flush_log(self, widget: scrolledtext.ScrolledText):
+        """Append all queued log lines to a text widget in one insert"""
+        entries = self._log_buffers.pop(widget, None)
+        if not entries:
+            return
+        
+        widget.config(state=tk.NORMAL)
+        widget.insert(tk.END, "".join(entries))
+        widget.see(tk.END)
+        widget.config(state=tk.DISABLED)
     
     def browse_backup_dir(self):
         """Browse for backup directory"""
@@ -1497,27 +2152,27 @@ Raw Data:
     
     def create_full_backup(self):
         """Create a full backup"""
+        progress = self.start_progress()
+        
         def backup_task():
-            self.progress_bar.start()
-            self.update_status("Creating full backup...")
+            self._post_ui(self.update_status, "Creating full backup...")
             
             try:
                 backup_info = self.backup_manager.create_full_backup()
                 
                 if backup_info:
-                    self.root.after(0, lambda: [
-                        messagebox.showinfo("Success", f"Full backup created successfully!\n\nFilename: {backup_info.filename}\nSize: {backup_info.size / (1024*1024):.1f} MB\nConversations: {backup_info.conversation_count}"),
-                        self.refresh_backup_history()
-                    ])
+                    message = f"Full backup created successfully!\n\nFilename: {backup_info.filename}\nSize: {backup_info.size / MiB:.1f} MB\nConversations: {backup_info.conversation_count}"
+                    self._post_ui(messagebox.showinfo, "Success", message)
+                    self._post_ui(self.refresh_backup_history)
                 else:
-                    self.root.after(0, lambda: messagebox.showerror("Error", "Failed to create backup"))
+                    self._post_ui(messagebox.showerror, "Error", "Failed to create backup")
                     
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Backup failed: {e}"))
+                self._post_ui(messagebox.showerror, "Error", f"Backup failed: {e}")
             finally:
-                self.root.after(0, lambda: [self.progress_bar.stop(), self.update_status("Ready")])
+                self._post_ui(lambda: [self.stop_progress(progress), self.update_status("Ready")])
         
-        threading.Thread(target=backup_task, daemon=True).start()
+        self._submit(backup_task)
     
     def create_incremental_backup(self):
         """Create an incremental backup"""
@@ -1532,76 +2187,123 @@ Raw Data:
         last_backup = max(history, key=lambda x: x.timestamp)
         since_timestamp = last_backup.timestamp
         
+        progress = self.start_progress()
+        
         def backup_task():
-            self.progress_bar.start()
-            self.update_status("Creating incremental backup...")
+            self._post_ui(self.update_status, "Creating incremental backup...")
             
             try:
                 backup_info = self.backup_manager.create_incremental_backup(since_timestamp)
                 
                 if backup_info:
-                    self.root.after(0, lambda: [
-                        messagebox.showinfo("Success", f"Incremental backup created successfully!\n\nFilename: {backup_info.filename}\nSize: {backup_info.size / (1024*1024):.1f} MB\nNew Conversations: {backup_info.conversation_count}"),
-                        self.refresh_backup_history()
-                    ])
+                    message = f"Incremental backup created successfully!\n\nFilename: {backup_info.filename}\nSize: {backup_info.size / MiB:.1f} MB\nNew Conversations: {backup_info.conversation_count}"
+                    self._post_ui(messagebox.showinfo, "Success", message)
+                    self._post_ui(self.refresh_backup_history)
                 else:
-                    self.root.after(0, lambda: messagebox.showinfo("Info", "No new conversations found for incremental backup"))
+                    self._post_ui(messagebox.showinfo, "Info", "No new conversations found for incremental backup")
                     
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Incremental backup failed: {e}"))
+                self._post_ui(messagebox.showerror, "Error", f"Incremental backup failed: {e}")
             finally:
-                self.root.after(0, lambda: [self.progress_bar.stop(), self.update_status("Ready")])
+                self._post_ui(lambda: [self.stop_progress(progress), self.update_status("Ready")])
         
-        threading.Thread(target=backup_task, daemon=True).start()
+        self._submit(backup_task)
     
     def cleanup_backups(self):
         """Cleanup old backups"""
+        progress = self.start_progress()
+        
         def cleanup_task():
-            self.progress_bar.start()
-            self.update_status("Cleaning up old backups...")
+            self._post_ui(self.update_status, "Cleaning up old backups...")
             
             try:
                 removed_count = self.backup_manager.cleanup_old_backups()
                 
-                self.root.after(0, lambda: [
-                    messagebox.showinfo("Success", f"Cleanup completed!\n\nRemoved {removed_count} old backup files."),
-                    self.refresh_backup_history()
-                ])
+                self._post_ui(messagebox.showinfo, "Success", f"Cleanup completed!\n\nRemoved {removed_count} old backup files.")
+                self._post_ui(self.refresh_backup_history)
                 
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Cleanup failed: {e}"))
+                self._post_ui(messagebox.showerror, "Error", f"Cleanup failed: {e}")
             finally:
-                self.root.after(0, lambda: [self.progress_bar.stop(), self.update_status("Ready")])
+                self._post_ui(lambda: [self.stop_progress(progress), self.update_status("Ready")])
         
-        threading.Thread(target=cleanup_task, daemon=True).start()
+        self._submit(cleanup_task)
     
     def refresh_backup_history(self):
         """Refresh backup history display"""
-        # Clear existing items
-        for item in self.backup_tree.get_children():
-            self.backup_tree.delete(item)
-        
+        # Rows are read and formatted in the worker; only the diff runs here
+        self._run_in_worker(self._compute_backup_rows, done_cb=self._apply_backup_rows)
+    
+    def _compute_backup_rows(self) -> Dict[str, tuple]:
+        """Load the backup history as treeview values by filename, newest first"""
         # Load backup history
         history = self.backup_manager.get_backup_history()
         
         # Sort by timestamp (newest first)
         history.sort(key=lambda x: x.timestamp, reverse=True)
         
-        # Add to tree
+        # Rows are keyed by filename, which also serves as the item id
+        rows = {}
         for backup in history:
             timestamp_str = backup.timestamp.replace('_', ' ')
-            size_mb = f"{backup.size / (1024*1024):.1f} MB"
+            size_mb = f"{backup.size / MiB:.1f} MB"
             
-            self.backup_tree.insert("", tk.END, values=(
+            rows.setdefault(backup.filename, (
                 timestamp_str,
                 backup.filename,
                 backup.backup_type.title(),
                 size_mb,
                 str(backup.conversation_count)
             ))
+        return rows
+    
+    def _apply_backup_rows(self, rows: Dict[str, tuple]):
+        """Show computed backup rows, touching only what changed"""
+        # Nothing to do when the history reads back exactly as shown
+        if list(rows.items()) == list(self._backup_rows.items()):
+            return
+        
+        # Only touch the rows that were added, removed or changed
+        removed = [iid for iid in self._backup_rows if iid not in rows]
+        if removed:
+            self.backup_tree.delete(*removed)
+        
+        created = []
+        updated = []
+        for iid, values in rows.items():
+            old_values = self._backup_rows.get(iid)
+            if old_values is None:
+                created.extend((iid, values))
+            elif old_values != values:
+                updated.extend((iid, values))
+        
+        # One Tcl loop per kind of change, as in _render_conversations
+        call = self.backup_tree.tk.call
+        widget = self.backup_tree._w
+        if created:
+            call("foreach", ("row_iid", "row_values"), created,
+                 f"{widget} insert {{}} end -id $row_iid -values $row_values")
+        if updated:
+            call("foreach", ("row_iid", "row_values"), updated,
+                 f"{widget} item $row_iid -values $row_values")
+        
+        order = list(rows)
+        if list(self.backup_tree.get_children()) != order:
+            self.backup_tree.set_children("", *order)
+        
+        self._backup_rows = rows
+    
+    @property
+    def _backup_dir_path(self) -> Path:
+        """Backup directory as a Path, rebuilt only when the setting changes"""
+        backup_dir = self.backup_config.backup_dir
+        cached = self._backup_dir_cache
+        if cached is None or cached[0] != backup_dir:
+            cached = self._backup_dir_cache = (backup_dir, Path(backup_dir))
+        return cached[1]
     
     def verify_selected_backup(self):
-        """Verify selected backup"""
+        """Verify the selected backups"""
         selected_items = self.backup_tree.selection()
         
         if not selected_items:
@@ -1609,48 +2311,62 @@ Raw Data:
             return
         
         # Get selected backup info
-        item = selected_items[0]
-        values = self.backup_tree.item(item)['values']
-        filename = values[1]
+        filenames = [self.backup_tree.item(item)['values'][1] for item in selected_items]
+        backup_dir = self._backup_dir_path
         
-        backup_path = Path(self.backup_config.backup_dir) / filename
+        progress = self.start_progress()
         
         def verify_task():
-            self.progress_bar.start()
-            self.update_status("Verifying backup...")
+            self._post_ui(self.update_status, "Verifying backup..." if len(filenames) == 1
+                          else f"Verifying {len(filenames)} backups...")
             
             try:
-                is_valid = self.backup_manager.verify_backup(str(backup_path))
+                results = self.backup_manager.verify_backups([str(backup_dir / name) for name in filenames])
+                failed = [name for name in filenames if not results[str(backup_dir / name)]]
                 
-                if is_valid:
-                    self.root.after(0, lambda: messagebox.showinfo("Success", f"Backup verification passed!\n\n{filename} is valid."))
+                if len(filenames) == 1:
+                    filename = filenames[0]
+                    if not failed:
+                        self._post_ui(messagebox.showinfo, "Success", f"Backup verification passed!\n\n{filename} is valid.")
+                    else:
+                        self._post_ui(messagebox.showerror, "Error", f"Backup verification failed!\n\n{filename} may be corrupted.")
+                elif not failed:
+                    self._post_ui(messagebox.showinfo, "Success", f"Backup verification passed!\n\nAll {len(filenames)} backups are valid.")
                 else:
-                    self.root.after(0, lambda: messagebox.showerror("Error", f"Backup verification failed!\n\n{filename} may be corrupted."))
+                    listed = "\n".join(failed)
+                    self._post_ui(messagebox.showerror, "Error",
+                                  f"Backup verification failed for {len(failed)} of {len(filenames)} backups:\n\n{listed}")
                     
             except Exception as e:
-                self.root.after(0, lambda: messagebox.showerror("Error", f"Verification failed: {e}"))
+                self._post_ui(messagebox.showerror, "Error", f"Verification failed: {e}")
             finally:
-                self.root.after(0, lambda: [self.progress_bar.stop(), self.update_status("Ready")])
+                self._post_ui(lambda: [self.stop_progress(progress), self.update_status("Ready")])
         
-        threading.Thread(target=verify_task, daemon=True).start()
+        self._submit(verify_task)
     
     def open_backup_folder(self):
         """Open backup folder in file manager"""
         import subprocess
-        import platform
         
         try:
-            backup_dir = Path(self.backup_config.backup_dir)
+            backup_dir = self._backup_dir_path
             
-            if platform.system() == "Linux":
-                subprocess.run(["xdg-open", str(backup_dir)], check=True)
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", str(backup_dir)], check=True)
-            elif platform.system() == "Windows":
-                subprocess.run(["explorer", str(backup_dir)], check=True)
+            if _SYSTEM == "Linux":
+                command = ["xdg-open", str(backup_dir)]
+            elif _SYSTEM == "Darwin":  # macOS
+                command = ["open", str(backup_dir)]
+            elif _SYSTEM == "Windows":
+                command = ["explorer", str(backup_dir)]
             else:
                 messagebox.showinfo("Info", f"Backup folder:\n{backup_dir}")
-                
+                return
+            
+            # Launch without waiting, as the file manager can be slow to start
+            subprocess.Popen(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL, close_fds=True, start_new_session=True)
+            
+        except FileNotFoundError:
+            messagebox.showerror("Error", f"Failed to open backup folder: {command[0]} is not installed")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open backup folder: {e}")
     
@@ -1664,7 +2380,7 @@ Raw Data:
     
     def save_config(self):
         """Save application configuration"""
-        config_path = Path.home() / ".warp-chat-archiver-config.json"
+        config_path = self.CONFIG_PATH
         
         try:
             config_data = {
@@ -1678,26 +2394,65 @@ Raw Data:
                     'refresh_interval': self.refresh_interval_var.get()
                 }
             }
-            
-            with open(config_path, 'w', encoding='utf-8') as f:
-                json.dump(config_data, f, indent=2, ensure_ascii=False)
-            
-            messagebox.showinfo("Success", f"Configuration saved to:\n{config_path}")
-            
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save configuration: {e}")
+            return
+        
+        def save_task():
+            try:
+                # Serialize up front; an unchanged payload is already on disk
+                payload = json.dumps(config_data, indent=2, ensure_ascii=False).encode('utf-8')
+                digest = hashlib.blake2b(payload, digest_size=8).digest()
+                # Skip only while the file on disk is still the one last seen
+                state = self._config_file_state(config_path, digest)
+                if state is None or state != self._config_state:
+                    # Write beside the target and swap it in, so a crash never
+                    # leaves a truncated configuration behind
+                    temp_path = config_path.with_name(config_path.name + ".tmp")
+                    temp_path.write_bytes(payload)
+                    os.replace(temp_path, config_path)
+                    self._config_state = self._config_file_state(config_path, digest)
+                
+                self._post_ui(messagebox.showinfo, "Success", f"Configuration saved to:\n{config_path}")
+                
+            except Exception as e:
+                self._post_ui(messagebox.showerror, "Error", f"Failed to save configuration: {e}")
+        
+        self._run_in_worker(save_task)
+    
+    def _config_file_state(self, config_path: Path, digest: bytes) -> Optional[tuple]:
+        """Pair a content digest with the file's current mtime and size"""
+        try:
+            st = config_path.stat()
+        except OSError:
+            return None
+        return (digest, st.st_mtime_ns, st.st_size)
     
     def load_config(self):
         """Load application configuration"""
-        config_path = Path.home() / ".warp-chat-archiver-config.json"
+        config_path = self.CONFIG_PATH
         
-        if not config_path.exists():
-            return
+        def load_task():
+            try:
+                payload = config_path.read_bytes()
+                config_data = json.loads(payload)
+            except FileNotFoundError:
+                return
+            except Exception as e:
+                self.logger.error(f"Failed to load configuration: {e}")
+                return
+            
+            digest = hashlib.blake2b(payload, digest_size=8).digest()
+            self._config_state = self._config_file_state(config_path, digest)
+            
+            # Apply in main thread
+            self._post_ui(self._apply_config, config_data)
         
+        self._run_in_worker(load_task)
+    
+    def _apply_config(self, config_data: Dict[str, Any]):
+        """Apply a loaded configuration to the managers and UI"""
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
-            
             # Load backup config
             if 'backup_config' in config_data:
                 backup_config_dict = config_data['backup_config']
@@ -1717,7 +2472,7 @@ Raw Data:
                 
                 self.export_format_var.set(ui_settings.get('export_format', 'json'))
                 self.export_mode_var.set(ui_settings.get('export_mode', 'single'))
-                self.export_path_var.set(ui_settings.get('export_path', str(Path.home() / "warp_exports")))
+                self.export_path_var.set(ui_settings.get('export_path', self.DEFAULT_EXPORT_DIR))
                 self.log_level_var.set(ui_settings.get('log_level', 'INFO'))
                 self.auto_refresh_var.set(ui_settings.get('auto_refresh', True))
                 self.refresh_interval_var.set(ui_settings.get('refresh_interval', 30))
@@ -1731,7 +2486,7 @@ Raw Data:
         
         if result:
             # Reset backup config
-            self.backup_config = BackupConfig(backup_dir=str(Path.home() / "warp-chat-backups"))
+            self.backup_config = BackupConfig(backup_dir=self.DEFAULT_BACKUP_DIR)
             self.backup_manager = BackupManager(self.backup_config)
             
             # Reset UI variables
@@ -1743,7 +2498,7 @@ Raw Data:
             
             self.export_format_var.set('json')
             self.export_mode_var.set('single')
-            self.export_path_var.set(str(Path.home() / "warp_exports"))
+            self.export_path_var.set(self.DEFAULT_EXPORT_DIR)
             self.log_level_var.set('INFO')
             self.auto_refresh_var.set(True)
             self.refresh_interval_var.set(30)
@@ -1752,18 +2507,56 @@ Raw Data:
     
     def refresh_statistics(self):
         """Refresh statistics display"""
-        # This would recreate the statistics tab
-        # For now, just show a message
-        messagebox.showinfo("Info", "Statistics refreshed.\n\nNote: To see updated statistics, restart the application.")
+        self._stats_cache.clear()
+        self._run_in_worker(self._compute_statistics, done_cb=self._show_statistics)
+    
+    def start_progress(self) -> int:
+        """Register a running task; the progress bar only appears if it takes over 100 ms"""
+        token = next(self._progress_tokens)
+        self._active_progress.add(token)
+        self.root.after(100, self._maybe_show_progress, token)
+        return token
+    
+    def _maybe_show_progress(self, token: int):
+        """Start the progress bar for a task that is still running"""
+        if token in self._active_progress and not self._progress_visible:
+            self._progress_visible = True
+            self.progress_bar.start()
+    
+    def stop_progress(self, token: int):
+        """Unregister a task, stopping the progress bar once none are left"""
+        self._active_progress.discard(token)
+        if self._progress_visible and not self._active_progress:
+            self._progress_visible = False
+            self.progress_bar.stop()
     
     def update_status(self, message: str):
         """Update status bar message"""
+        # Tk repaints on its next idle pass; forcing it here stalls the
+        # event loop when tasks report progress in quick succession
         self.status_label.config(text=message)
-        self.root.update_idletasks()
+    
+    def _submit(self, task):
+        """Run task in the action pool, unless the window closes before it starts"""
+        def run():
+            if not self._closing.is_set():
+                task()
+        
+        self._executor.submit(run)
+    
+    def on_closing(self):
+        """Stop accepting background work and close the window"""
+        self._closing.set()
+        self._executor.shutdown(wait=False)
+        self._search_executor.shutdown(wait=False)
+        self.root.destroy()
     
     def run(self):
         """Run the application"""
         self.root.mainloop()
+        
+        # Let actions already writing files finish before the process exits
+        self._executor.shutdown(wait=True)
 
 
 def main():